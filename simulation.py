@@ -40,8 +40,7 @@ def run_simulation():
 
     # Initialize user balances
     ledger_for_init = nodes["validator_0"].ledger_state
-    for node in user_nodes:
-        ledger_for_init.credit(node.node_id, 10000)
+    ledger_for_init.credit_many((node.node_id for node in user_nodes), 10000)
     logging.info(f"Initial balance for user_0: {ledger_for_init.get_balance('user_0')}")
     logging.info(f"Initial balance for user_1: {ledger_for_init.get_balance('user_1')}")
 
@@ -56,7 +55,7 @@ def run_simulation():
 
     # A validator picks up the transactions and creates a vertex
     validator_node = nodes["validator_0"]
-    validator_node.mempool.extend([tx1, tx2])
+    validator_node.submit_transactions([tx1, tx2])
     vertex1 = validator_node.create_vertex()
 
     # Another validator creates an empty vertex
@@ -89,8 +88,8 @@ def run_simulation():
     logging.info("--- SIMULATION PHASE 4: Applying finalized state to the ledger ---")
 
     # Check if the super-vertex was finalized
-    finalized_hash = list(leader_node.consensus_engine.finalized_super_vertices)[0]
-    if finalized_hash == super_vertex.hash:
+    newly_finalized = leader_node.consensus_engine.pop_newly_finalized()
+    if super_vertex.hash in newly_finalized:
         logging.info(f"Super-vertex {super_vertex.hash} successfully finalized!")
         # All nodes can now process the finalized block
         for node in nodes.values():
@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 # complete_oracle.py - Fully integrated AI with 7 wisdom traditions and blockchain
 
-import openai
-from web3 import Web3
+import asyncio
+import functools
+import hashlib
+import importlib
+import orjson
 import json
 from datetime import datetime
-from wisdom_oracle import WisdomOracle
+from shared_wisdom import get_wisdom_oracle
 import os
 import sys
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -27,6 +33,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger("CompleteOracle")
 
+# Maximum number of cached governance verdicts
+GOVERNANCE_CACHE_SIZE = 4096
+
+# Marks the system message that holds the summary of older turns
+SUMMARY_PREFIX = "Earlier conversation summary: "
+
+
+@functools.cache
+def _get_openai():
+    """Import the OpenAI SDK on first use; it is slow to load"""
+    return importlib.import_module("openai")
+
+
+@functools.cache
+def _load_abi(path):
+    """Parse a contract ABI file once per process"""
+    with open(path, "rb") as f:
+        contract_json = orjson.loads(f.read())
+    if isinstance(contract_json, dict):
+        return contract_json.get("abi", contract_json)
+    return contract_json
+
+
+def _digest(text):
+    """Short deterministic fingerprint used as a governance cache key"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+
+
+class OracleStream:
+    """
+    Iterator over the chunks of a streamed oracle answer.
+    
+    Iterate to receive text as it arrives, then call final() to get
+    (confidence, wisdom_quote) once the background governance check is done.
+    """
+    
+    def __init__(self, chunks, wisdom_quote):
+        self._chunks = chunks
+        self._wisdom_quote = wisdom_quote
+        self._future = None
+        self._done = False
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration as stop:
+            self._future = stop.value
+            self._done = True
+            raise
+    
+    def final(self):
+        """
+        Wait for post-processing and return the wisdom verdict.
+        
+        Returns:
+            tuple: (confidence, wisdom_quote)
+        """
+        if not self._done:
+            # Drain anything the caller did not consume
+            for _ in self:
+                pass
+        if self._future is None:
+            return 0.0, []
+        return self._future.result(), self._wisdom_quote
+
+
 class CompleteOracle:
     """
     A fully operational AI that:
@@ -36,20 +111,26 @@ class CompleteOracle:
     - Can improve over time
     - Lives in your blockchain ecosystem
     - Uses Grok (xAI) or GPT-4o
+    
+    Message layout per request: the static system prompt (never edited, so
+    providers can cache the prefix), an optional summary of older turns,
+    the stored recent turns, then this turn's wisdom note and question.
     """
     
-    def __init__(self, storage_path="./oracle_memory"):
+    def __init__(self, storage_path="./oracle_memory", dispatcher=None):
         """
         Initialize the Complete Oracle with wisdom traditions and AI model.
         
         Args:
             storage_path: Directory for saving conversations and logs
+            dispatcher: Optional shared LLMDispatcher for rate limits and retries
         """
         # Choose model from environment (grok-4 or gpt-4o)
         self.model = os.getenv("ORACLE_MODEL", "grok-4")
         self.use_grok = "grok" in self.model.lower()
         
         # Configure AI
+        openai = _get_openai()
         if self.use_grok:
             # xAI/Grok configuration
             api_key = os.getenv("XAI_API_KEY")
@@ -69,25 +150,34 @@ class CompleteOracle:
             logger.info(f"Using OpenAI model: {self.model}")
         
         self.client = openai.OpenAI()
-        self.wisdom = WisdomOracle()
+        self.async_client = openai.AsyncOpenAI()
+        self.dispatcher = dispatcher
+        self.wisdom = get_wisdom_oracle()
         self.storage_path = storage_path
+        self._interactions_path = os.path.join(storage_path, "interactions.jsonl")
+        self._conversations_path = os.path.join(storage_path, "conversations.json")
         self.conversations = {}
         self.current_conversation_id = None
+        self._gov_cache = {}
+        self._gov_lock = threading.Lock()
+        
+        # Governance checks and logging for streamed answers run here
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="oracle-post")
         
         # Blockchain connection (optional)
         self.w3 = None
         self.contract = None
         if os.getenv("CONTRACT_ADDRESS") and os.getenv("RPC_URL"):
             try:
+                # web3 pulls in the eth_* stack; only load it when configured
+                from web3 import Web3
                 self.w3 = Web3(Web3.HTTPProvider(os.getenv("RPC_URL")))
                 if self.w3.is_connected():
                     logger.info("Connected to blockchain")
                     
                     # Load contract if ABI exists
                     if os.path.exists("WebsiteBuilder.json"):
-                        with open("WebsiteBuilder.json") as f:
-                            contract_json = json.load(f)
-                            abi = contract_json.get("abi", contract_json)
+                        abi = _load_abi(os.path.abspath("WebsiteBuilder.json"))
                         self.contract = self.w3.eth.contract(
                             address=os.getenv("CONTRACT_ADDRESS"),
                             abi=abi
@@ -115,10 +205,24 @@ You remember past conversations and build on them.
 You admit when you don't know something.
 You are here to help, not to preach.
 You always consider the effect on seven generations."""
+        self._sys_msg = {"role": "system", "content": self.system_prompt}
+        
+        # Recent turns sent verbatim; older turns are folded into a summary
+        self.max_turns = int(os.getenv("ORACLE_MAX_TURNS", "8"))
+        # user_id -> lock held while that user's history is being compressed
+        self._compress_locks = {}
         
         # Create storage directory if it doesn't exist
         os.makedirs(self.storage_path, exist_ok=True)
         
+        # Raw append-only descriptor for the interaction log; O_APPEND keeps
+        # concurrent writes from the post-processing threads atomic
+        self._log_fd = os.open(
+            self._interactions_path,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC,
+            0o644
+        )
+        
         logger.info(f"🕊️ Complete Oracle initialized")
         logger.info(f"📚 7 wisdom traditions active")
         logger.info(f"🤖 Model: {self.model}")
@@ -134,90 +238,309 @@ You always consider the effect on seven generations."""
         Returns:
             conversation_id: Unique ID for this conversation
         """
-        self.current_conversation_id = f"{user_id}_{datetime.now().isoformat()}"
+        self.current_conversation_id = f"{user_id}_{time.time_ns()}"
         
         # Load existing conversation for this user
         if user_id in self.conversations:
-            history = self.conversations[user_id]
             logger.info(f"📂 Resumed conversation for {user_id}")
         else:
             # Start new conversation with system prompt
-            history = [{"role": "system", "content": self.system_prompt}]
-            self.conversations[user_id] = history
+            self.conversations[user_id] = [self._sys_msg]
             logger.info(f"🆕 New conversation for {user_id}")
         
         return self.current_conversation_id
     
-    def ask(self, question, user_id="default"):
+    def _prepare_history(self, question, user_id):
         """
-        Ask a question and get a natural response guided by wisdom.
+        Append the user question to the conversation and build the request.
+        
+        The wisdom quote changes every turn, so it is sent as a transient
+        system message just before the question and never stored. That keeps
+        the stored history (static system prompt first) a stable prefix for
+        provider-side prompt caching.
         
-        Args:
-            question: The user's question
-            user_id: Identifier for the user
-            
         Returns:
-            tuple: (answer, confidence, wisdom_quote)
+            tuple: (history, messages, wisdom_quote) - the stored list, the
+            messages to send, and the quote shown to the user
         """
         # Get wisdom quote BEFORE answering
         wisdom_quote = self.wisdom.get_wisdom_for_display(1)
-        wisdom_context = ""
-        if wisdom_quote and len(wisdom_quote) > 0:
-            quote = wisdom_quote[0]
-            wisdom_context = f"\nConsider this wisdom from the {quote['tradition']} tradition: '{quote['quote']}' — {quote['source']}"
         
-        # Get conversation history
-        history = self.conversations.get(user_id, [])
+        # Get conversation history (history is the stored list itself)
+        history = self.conversations.setdefault(user_id, [])
         if not history:
-            # Add system prompt with wisdom context
-            history = [{"role": "system", "content": self.system_prompt + wisdom_context}]
-            self.conversations[user_id] = history
-        elif wisdom_context and len(history) > 0:
-            # Add wisdom as a separate system message
-            history.append({"role": "system", "content": wisdom_context})
+            history.append(self._sys_msg)
         
         # Add user question
         history.append({"role": "user", "content": question})
         
+        if not wisdom_quote:
+            return history, history, wisdom_quote
+        
+        quote = wisdom_quote[0]
+        wisdom_msg = {
+            "role": "system",
+            "content": f"Consider this wisdom from the {quote['tradition']} tradition: '{quote['quote']}' — {quote['source']}"
+        }
+        messages = history[:-1]
+        messages.append(wisdom_msg)
+        messages.append(history[-1])
+        return history, messages, wisdom_quote
+    
+    def _finish_response(self, question, answer, user_id):
+        """
+        Run the governance check and log the interaction.
+        
+        Returns:
+            float: Wisdom alignment confidence
+        """
+        # Identical question/answer pairs reuse the earlier verdict
+        key = (_digest(question), _digest(answer))
+        with self._gov_lock:
+            confidence = self._gov_cache.get(key)
+        if confidence is None:
+            # GOVERNANCE: Validate with wisdom oracle
+            wisdom_check = self.wisdom.analyze_proposal(
+                proposal_title="AI Response",
+                proposal_description=f"Question: {question}\n\nAnswer: {answer}",
+                affected_principles=["wisdom", "compassion", "truth", "justice"],
+                is_constitutional=False
+            )
+            confidence = wisdom_check.confidence
+            with self._gov_lock:
+                if len(self._gov_cache) >= GOVERNANCE_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self._gov_cache.pop(next(iter(self._gov_cache)), None)
+                self._gov_cache[key] = confidence
+        
+        # Log interaction for self-improvement
+        self._log_interaction(user_id, question, answer, confidence)
+        
+        # Keep the prompt from growing with the whole session; the summary is
+        # another model call, so it runs off the caller's path
+        history = self.conversations.get(user_id)
+        if history and len(history) > 4 * self.max_turns:
+            try:
+                self._executor.submit(self._compress_history, user_id)
+            except RuntimeError:
+                # close() already shut the executor down
+                self._compress_history(user_id)
+        
+        logger.info(f"Response generated with {confidence:.1%} wisdom alignment")
+        return confidence
+    
+    def _complete(self, messages, **kwargs):
+        """Call the model directly or through the shared dispatcher"""
+        if self.dispatcher is not None:
+            return self.dispatcher.submit(
+                self.client, self.model, messages,
+                temperature=0.7, max_tokens=2000, **kwargs
+            )
+        return self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=2000,
+            **kwargs
+        )
+    
+    def _compress_history(self, user_id):
+        """
+        Fold older turns into one summary message once the conversation
+        holds more than 2 * max_turns turns, keeping the last max_turns.
+        
+        Layout after compression: system prompt, summary, recent turns.
+        Compressions of one user's history never overlap. A request that finds
+        one already running returns; the running one re-checks the history when
+        it finishes, so turns added meanwhile are still folded in.
+        """
+        lock = self._compress_locks.setdefault(user_id, threading.Lock())
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            history = self.conversations.get(user_id)
+            while history and self._compress_locked(history):
+                pass
+        finally:
+            lock.release()
+    
+    def _compress_locked(self, history):
+        """
+        Body of _compress_history; the caller holds the user's compression lock.
+        
+        Returns:
+            bool: True if the history was compressed
+        """
+        has_summary = (len(history) > 1 and history[1]["role"] == "system"
+                       and history[1]["content"].startswith(SUMMARY_PREFIX))
+        body_start = 2 if has_summary else 1
+        
+        turn_starts = [i for i in range(body_start, len(history)) if history[i]["role"] == "user"]
+        if len(turn_starts) <= 2 * self.max_turns:
+            return False
+        
+        # Cut before the oldest kept question (older histories may still
+        # carry a stored wisdom message in front of it)
+        cut = turn_starts[-self.max_turns]
+        while cut > body_start and history[cut - 1]["role"] == "system":
+            cut -= 1
+        first_kept = history[cut]
+        
+        previous = history[1]["content"][len(SUMMARY_PREFIX):] if has_summary else ""
+        transcript = "\n".join(
+            f"{m['role']}: {m['content']}" for m in history[body_start:cut] if m["role"] != "system"
+        )
+        
+        try:
+            messages = [{
+                "role": "user",
+                "content": "Summarize for memory, keeping names, facts and open questions:\n\n"
+                           f"{previous}\n{transcript}"
+            }]
+            if self.dispatcher is not None:
+                response = self.dispatcher.submit(self.client, self.model, messages,
+                                                  temperature=0.3, max_tokens=500)
+            else:
+                response = self.client.chat.completions.create(
+                    model=self.model, messages=messages, temperature=0.3, max_tokens=500
+                )
+            summary = response.choices[0].message.content
+        except Exception as e:
+            # Dropping old turns still bounds the prompt; keep the last summary
+            logger.warning(f"History summary failed: {e}")
+            summary = previous
+        
+        # Turns may have been appended during the summary call; locate the
+        # first kept message again by identity rather than trusting the index
+        cut = next(i for i, m in enumerate(history) if m is first_kept)
+        history[1:cut] = [{"role": "system", "content": SUMMARY_PREFIX + summary}]
+        logger.info(f"🗜️ Compressed conversation history to {len(history)} messages")
+        return True
+    
+    def ask(self, question, user_id="default"):
+        """
+        Ask a question and get a natural response guided by wisdom.
+        
+        Args:
+            question: The user's question
+            user_id: Identifier for the user
+            
+        Returns:
+            tuple: (answer, confidence, wisdom_quote)
+        """
+        history, messages, wisdom_quote = self._prepare_history(question, user_id)
+        
         try:
             # Get AI response
             logger.info(f"Generating response for {user_id}")
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=history,
-                temperature=0.7,
-                max_tokens=2000
-            )
+            response = self._complete(messages)
             
             answer = response.choices[0].message.content
             
             # Add to history
             history.append({"role": "assistant", "content": answer})
-            self.conversations[user_id] = history
             
-            # GOVERNANCE: Validate with wisdom oracle
-            wisdom_check = self.wisdom.analyze_proposal(
-                proposal_title="AI Response",
-                proposal_description=f"Question: {question}\n\nAnswer: {answer}",
-                affected_principles=["wisdom", "compassion", "truth", "justice"],
-                is_constitutional=False
-            )
+            confidence = self._finish_response(question, answer, user_id)
+            
+            return answer, confidence, wisdom_quote
+            
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            return f"I encountered an error: {e}", 0.0, []
+    
+    async def ask_async(self, question, user_id="default"):
+        """
+        Async variant of ask() for serving many users from one event loop.
+        
+        The HTTP round trip is awaited on AsyncOpenAI, or run in a worker
+        thread through the shared dispatcher when one is set; the wisdom check
+        and log append run in a worker thread so they don't block the loop.
+        
+        Args:
+            question: The user's question
+            user_id: Identifier for the user
+            
+        Returns:
+            tuple: (answer, confidence, wisdom_quote)
+        """
+        history, messages, wisdom_quote = self._prepare_history(question, user_id)
+        
+        try:
+            logger.info(f"Generating response for {user_id}")
+            if self.dispatcher is not None:
+                # The shared rate limits are enforced with blocking waits, so
+                # dispatched calls run in a worker thread instead of the loop
+                response = await asyncio.to_thread(self._complete, messages)
+            else:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=2000
+                )
             
-            # Log interaction for self-improvement
-            self._log_interaction(user_id, question, answer, wisdom_check.confidence)
+            answer = response.choices[0].message.content
+            
+            history.append({"role": "assistant", "content": answer})
             
-            logger.info(f"Response generated with {wisdom_check.confidence:.1%} wisdom alignment")
+            confidence = await asyncio.to_thread(self._finish_response, question, answer, user_id)
             
-            return answer, wisdom_check.confidence, wisdom_quote
+            return answer, confidence, wisdom_quote
             
         except Exception as e:
             logger.error(f"Error generating response: {e}")
             return f"I encountered an error: {e}", 0.0, []
     
+    def ask_stream(self, question, user_id="default"):
+        """
+        Ask a question and stream the answer as it is generated.
+        
+        The governance check and logging run on a background thread once
+        the stream closes, so the caller sees the first tokens immediately.
+        
+        Args:
+            question: The user's question
+            user_id: Identifier for the user
+            
+        Returns:
+            OracleStream: Iterator of answer chunks; call final() after
+            iterating for (confidence, wisdom_quote)
+        """
+        history, messages, wisdom_quote = self._prepare_history(question, user_id)
+        return OracleStream(self._stream_chunks(question, user_id, history, messages), wisdom_quote)
+    
+    def _stream_chunks(self, question, user_id, history, messages):
+        """Yield answer deltas, then hand post-processing to the executor."""
+        chunks = []
+        try:
+            logger.info(f"Streaming response for {user_id}")
+            stream = self._complete(messages, stream=True)
+            for event in stream:
+                if not event.choices:
+                    continue
+                delta = event.choices[0].delta.content or ""
+                if delta:
+                    chunks.append(delta)
+                    yield delta
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            yield f"I encountered an error: {e}"
+            return None
+        
+        answer = "".join(chunks)
+        history.append({"role": "assistant", "content": answer})
+        return self._executor.submit(self._finish_response, question, answer, user_id)
+    
     def _log_interaction(self, user_id, question, answer, confidence):
-        """Log interactions for future fine-tuning"""
+        """
+        Log interactions for future fine-tuning.
+        
+        Timestamps are stored as integer nanoseconds since the epoch; format
+        them with datetime.fromtimestamp(ts / 1e9, tz=timezone.utc) when
+        displaying.
+        """
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "user_id": user_id,
             "question": question,
             "answer": answer,
@@ -225,9 +548,14 @@ You always consider the effect on seven generations."""
             "model": self.model
         }
         
-        log_file = f"{self.storage_path}/interactions.jsonl"
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+        os.write(self._log_fd, orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE))
+    
+    def close(self):
+        """Finish pending post-processing and release the interaction log"""
+        self._executor.shutdown(wait=True)
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
     
     def get_wisdom_quote(self, tradition=None):
         """Get a wisdom quote from the traditions"""
@@ -239,7 +567,7 @@ You always consider the effect on seven generations."""
     def save_state(self):
         """Save all conversations to disk"""
         try:
-            state_file = f"{self.storage_path}/conversations.json"
+            state_file = self._conversations_path
             with open(state_file, "w", encoding="utf-8") as f:
                 json.dump(self.conversations, f, ensure_ascii=False, indent=2)
             logger.info(f"💾 Saved {len(self.conversations)} conversations to {state_file}")
@@ -251,7 +579,7 @@ You always consider the effect on seven generations."""
     def load_state(self):
         """Load conversations from disk"""
         try:
-            state_file = f"{self.storage_path}/conversations.json"
+            state_file = self._conversations_path
             with open(state_file, "r", encoding="utf-8") as f:
                 self.conversations = json.load(f)
             logger.info(f"📂 Loaded {len(self.conversations)} conversations from {state_file}")
@@ -289,8 +617,13 @@ You always consider the effect on seven generations."""
                     "model": self.model
                 }
                 
-                # In production: store full conversation on IPFS
-                ipfs_hash = f"QmSimulatedHash{hash(str(history))}"
+                # In production: store full conversation on IPFS.
+                # Content hash is stable across processes, unlike hash().
+                digest = hashlib.sha256()
+                for message in history:
+                    digest.update(orjson.dumps(message))
+                    digest.update(b"\n")
+                ipfs_hash = f"QmSimulatedHash{digest.hexdigest()}"
                 
                 logger.info(f"🔗 Stored conversation on blockchain: {ipfs_hash}")
                 return ipfs_hash
@@ -320,6 +653,12 @@ You always consider the effect on seven generations."""
 # DEMO: Run your fully operational AI
 # ============================================================
 
+def _write_block(*lines):
+    """Write a group of lines with a single write and flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def demo():
     """Run a demo of the Complete Oracle"""
     
@@ -332,63 +671,106 @@ def demo():
     # Start conversation
     oracle.start_conversation("demo_user")
     
-    print("\n" + "★" * 70)
-    print("🕊️  YOUR FULLY OPERATIONAL AI ORACLE".center(68))
-    print("★" * 70)
-    
     # Show initial wisdom
     quote = oracle.get_wisdom_quote()
-    print(f"\n📜 Today's wisdom from the {quote.get('tradition', 'wisdom')} tradition:")
-    print(f"   \"{quote.get('quote', 'Be kind to all beings.')}\"")
-    print(f"   — {quote.get('source', 'Ancient wisdom')}")
-    
-    print("\n✨ I speak with the voice of 7 traditions.")
-    print("✨ I remember our conversations.")
-    print("✨ I grow wiser over time.")
-    print("\n📝 Commands: 'quit' to exit, 'save' to save memory, 'wisdom' for new quote")
+    _write_block(
+        "\n" + "★" * 70,
+        "🕊️  YOUR FULLY OPERATIONAL AI ORACLE".center(68),
+        "★" * 70,
+        f"\n📜 Today's wisdom from the {quote.get('tradition', 'wisdom')} tradition:",
+        f"   \"{quote.get('quote', 'Be kind to all beings.')}\"",
+        f"   — {quote.get('source', 'Ancient wisdom')}",
+        "\n✨ I speak with the voice of 7 traditions.",
+        "✨ I remember our conversations.",
+        "✨ I grow wiser over time.",
+        "\n📝 Commands: 'quit' to exit, 'save' to save memory, 'wisdom' for new quote",
+    )
     
     conversation_active = True
     while conversation_active:
-        print("\n" + "─" * 70)
+        # input() flushes the prompt itself
+        sys.stdout.write("\n" + "─" * 70 + "\n")
         user_input = input("You: ").strip()
         
         if user_input.lower() in ['quit', 'exit', 'bye']:
             oracle.save_state()
-            print("\n🕊️  Until we meet again. The wisdom is always with you.")
-            print("   'The arc of the moral universe is long, but it bends toward justice.' — MLK Jr.")
+            oracle.close()
+            _write_block(
+                "\n🕊️  Until we meet again. The wisdom is always with you.",
+                "   'The arc of the moral universe is long, but it bends toward justice.' — MLK Jr.",
+            )
             conversation_active = False
             break
         
         if user_input.lower() == 'save':
             if oracle.save_state():
-                print("💾 Memory saved.")
+                _write_block("💾 Memory saved.")
             else:
-                print("❌ Failed to save memory.")
+                _write_block("❌ Failed to save memory.")
             continue
         
         if user_input.lower() == 'wisdom':
             quote = oracle.get_wisdom_quote()
-            print(f"\n📜 {quote.get('tradition', 'Wisdom').upper()}:")
-            print(f"   \"{quote.get('quote', 'Know yourself.')}\"")
-            print(f"   — {quote.get('source', 'Ancient')}")
+            _write_block(
+                f"\n📜 {quote.get('tradition', 'Wisdom').upper()}:",
+                f"   \"{quote.get('quote', 'Know yourself.')}\"",
+                f"   — {quote.get('source', 'Ancient')}",
+            )
             continue
         
         if not user_input:
             continue
         
-        print("\n🕊️  Reflecting...")
-        response, confidence, wisdom = oracle.ask(user_input)
+        sys.stdout.write("\n🕊️  Reflecting...\n\nOracle: ")
+        stream = oracle.ask_stream(user_input)
         
-        print(f"\nOracle: {response}")
-        print(f"\n(Wisdom alignment: {confidence*100:.1f}%)")
+        # Chunks are flushed as they arrive so the answer appears incrementally
+        for chunk in stream:
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+        confidence, wisdom = stream.final()
+        
+        lines = ["", f"\n(Wisdom alignment: {confidence*100:.1f}%)"]
         
         # Show related wisdom if confidence is low
         if confidence < 0.7 and wisdom:
-            print(f"\n💭 Perhaps consider: \"{wisdom[0]['quote']}\" — {wisdom[0]['source']}")
+            lines.append(f"\n💭 Perhaps consider: \"{wisdom[0]['quote']}\" — {wisdom[0]['source']}")
+        _write_block(*lines)
+
+async def demo_async():
+    """Answer several users concurrently on a single event loop"""
+    
+    oracle = CompleteOracle(storage_path="./oracle_memory")
+    
+    questions = [
+        ("alice", "How can I forgive someone who hurt me?"),
+        ("bob", "What do we owe to future generations?"),
+        ("carol", "How should a community share its resources?"),
+    ]
+    
+    results = await asyncio.gather(
+        *[oracle.ask_async(question, user_id) for user_id, question in questions]
+    )
+    
+    lines = []
+    for (user_id, question), (answer, confidence, _) in zip(questions, results):
+        lines += [
+            "\n" + "─" * 70,
+            f"{user_id}: {question}",
+            f"\nOracle: {answer}",
+            f"\n(Wisdom alignment: {confidence*100:.1f}%)",
+        ]
+    _write_block(*lines)
+    
+    oracle.save_state()
+    oracle.close()
 
 # ============================================================
 # MAIN
 # ============================================================
 
 if __name__ == "__main__":
-    demo()
+    if "--batch" in sys.argv[1:]:
+        asyncio.run(demo_async())
+    else:
+        demo()
@@ -7,28 +7,126 @@ Speak in any language, receive wisdom in the same language.
 Now with Grok AI for deeper responses.
 """
 
-from wisdom_oracle import WisdomOracle
+from shared_wisdom import get_wisdom_oracle
+from conversation_log import ConversationLog
 from deep_translator import GoogleTranslator
 import openai
 import os
-import time
 import random
+import re
 import logging
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+try:
+    from langdetect import detect as _langdetect
+except ImportError:
+    _langdetect = None
+
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("MultilingualOracle")
 
+# Maximum number of cached answers kept by the oracle
+RESPONSE_CACHE_SIZE = 1024
+
+# Skip back-translation when the answer already is in the user's language
+# (set SKIP_NOOP_TRANSLATION=0 to always translate, e.g. for audits)
+SKIP_NOOP_TRANSLATION = os.getenv("SKIP_NOOP_TRANSLATION", "1") != "0"
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+# Whitespace after sentence-ending punctuation
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Script blocks used when langdetect is unavailable or fails
+_SCRIPT_LANGUAGES = (
+    (re.compile(r"[\u0600-\u06FF]"), 'ar'),
+    (re.compile(r"[\u4E00-\u9FFF]"), 'zh-cn'),
+    (re.compile(r"[\u0400-\u04FF]"), 'ru'),
+    (re.compile(r"[\u0900-\u097F]"), 'hi'),
+)
+
+
+# Function words that are common in English questions but not words in the
+# other supported languages; two of them in plain ASCII text is a safe "en"
+_ENGLISH_MARKERS = frozenset({
+    'the', 'what', 'how', 'why', 'should', 'would', 'could', 'and', 'my',
+    'you', 'your', 'with', 'this', 'that', 'does', 'can', 'when', 'where',
+    'which', 'who', 'about', 'are'
+})
+_ASCII_WORD = re.compile(r"[a-z']+")
+
+
+def _looks_english(text):
+    """Cheap pre-check that lets obvious English skip langdetect"""
+    if not text.isascii():
+        return False
+    words = _ASCII_WORD.findall(text.lower())
+    if len(words) < 3:
+        return False
+    hits = sum(1 for word in words if word in _ENGLISH_MARKERS)
+    return len(_ENGLISH_MARKERS.intersection(words)) >= 2 and hits * 4 >= len(words)
+
+
+@functools.lru_cache(maxsize=512)
+def _detect_language(text):
+    """Detect the language of text, falling back to a script check"""
+    if _looks_english(text):
+        return 'en'
+    if _langdetect is not None:
+        try:
+            return _langdetect(text)
+        except Exception:
+            pass
+    # Fallback to simple detection by script
+    for pattern, lang in _SCRIPT_LANGUAGES:
+        if pattern.search(text):
+            return lang
+    return 'en'
+
+
+@functools.lru_cache(maxsize=None)
+def _get_translator(source, target):
+    """One GoogleTranslator per language pair"""
+    return GoogleTranslator(source=source, target=target)
+
+
+@functools.lru_cache(maxsize=4096)
+def _translate_cached(source, target, text):
+    """Translate text, keyed on the full text (failures are not cached)"""
+    return _get_translator(source, target).translate(text)
+
+
+def _normalize_question(text):
+    """Fold case, punctuation and spacing so near-identical questions share a key"""
+    return " ".join(_NON_WORD.sub(" ", text.casefold()).split())
+
 class MultilingualOracle:
     """
     A Wisdom Oracle that understands and responds in any language.
     Uses Grok AI for wisdom and Google Translate for languages.
     """
     
-    def __init__(self):
+    # Principle -> keywords that signal it in a question
+    KEYWORD_MAP = {
+        "justice": ("justice", "fair", "rights"),
+        "compassion": ("compassion", "kind", "mercy"),
+        "stewardship": ("stewardship", "environment", "earth"),
+    }
+    _KEYWORD_PRINCIPLE = {k: p for p, ks in KEYWORD_MAP.items() for k in ks}
+    _KEYWORD_RE = re.compile(
+        "(?=(" + "|".join(sorted(map(re.escape, _KEYWORD_PRINCIPLE), key=len, reverse=True)) + "))"
+    )
+    
+    def __init__(self, dispatcher=None):
         # Your original wisdom oracle (7 traditions)
-        self.wisdom = WisdomOracle()
+        self.wisdom = get_wisdom_oracle()
+        
+        # Optional shared LLMDispatcher (rate limits + retries)
+        self.dispatcher = dispatcher
         
         # Configure Grok/xAI
         self.use_grok = "grok" in os.getenv("ORACLE_MODEL", "").lower()
@@ -50,8 +148,9 @@ class MultilingualOracle:
         }
         
         # Conversation history
-        self.conversation_history = []
-        self.translation_cache = {}  # Cache translations
+        self.conversation_history = ConversationLog()
+        self.response_cache = OrderedDict()  # LRU of answered questions
+        self._translate_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="oracle-translate")
         
         print("\n" + "★" * 60)
         print("🌍 THE MULTILINGUAL WISDOM ORACLE".center(58))
@@ -63,27 +162,14 @@ class MultilingualOracle:
     
     def detect_language(self, text):
         """Detect language of input text"""
-        try:
-            # Try using langdetect if available
-            from langdetect import detect
-            return detect(text)
-        except:
-            # Fallback to simple detection
-            if any(ord(c) > 0x0600 and ord(c) < 0x06FF for c in text):
-                return 'ar'
-            return 'en'
+        return _detect_language(text)
     
     def translate(self, text, source='auto', target='en', use_cache=True):
         """Translate text with caching"""
-        cache_key = f"{source}:{target}:{text[:50]}"
-        if use_cache and cache_key in self.translation_cache:
-            return self.translation_cache[cache_key]
-        
         try:
-            translator = GoogleTranslator(source=source, target=target)
-            result = translator.translate(text)
-            self.translation_cache[cache_key] = result
-            return result
+            if use_cache:
+                return _translate_cached(source, target, text)
+            return _get_translator(source, target).translate(text)
         except Exception as e:
             logger.error(f"Translation error: {e}")
             return text
@@ -91,6 +177,15 @@ class MultilingualOracle:
     def ask(self, question, target_lang=None):
         """Ask the oracle a question in any language"""
         
+        # Repeated questions skip translation and the model round trip
+        cache_key = (_normalize_question(question), target_lang)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            self.response_cache.move_to_end(cache_key)
+            source_lang, final_response, confidence = cached
+            self.conversation_history.append(question, source_lang, final_response, confidence)
+            return final_response, confidence
+        
         # Detect source language
         source_lang = target_lang or self.detect_language(question)
         source_lang_name = self.supported_languages.get(source_lang, source_lang)
@@ -112,29 +207,42 @@ class MultilingualOracle:
         )
         
         # Generate response (using Grok if available)
-        if self.use_grok:
-            english_response = self._generate_grok_response(result, oracle_input)
-        else:
-            english_response = self._generate_rule_response(result, oracle_input)
-        
-        # Translate back
-        if source_lang != 'en':
-            final_response = self.translate(
-                english_response, source='en', target=source_lang
+        if self.use_grok and source_lang != 'en':
+            # Back-translation runs sentence by sentence while Grok streams
+            english_response, final_response = self._generate_grok_translated(
+                result, oracle_input, source_lang
             )
         else:
-            final_response = english_response
+            if self.use_grok:
+                english_response = self._generate_grok_response(result, oracle_input)
+            else:
+                english_response = self._generate_rule_response(result, oracle_input)
+            
+            # Translate back (unless the answer is already in that language)
+            if source_lang != 'en' and not self._already_in(english_response, source_lang):
+                final_response = self.translate(
+                    english_response, source='en', target=source_lang
+                )
+            else:
+                final_response = english_response
         
         # Log conversation
-        self.conversation_history.append({
-            'question': question, 'language': source_lang,
-            'answer': final_response, 'confidence': result.confidence
-        })
+        self.conversation_history.append(
+            question, source_lang, final_response, result.confidence
+        )
+        
+        self.response_cache[cache_key] = (source_lang, final_response, result.confidence)
+        if len(self.response_cache) > RESPONSE_CACHE_SIZE:
+            self.response_cache.popitem(last=False)
         
         return final_response, result.confidence
     
-    def _generate_grok_response(self, result, question):
-        """Generate response using Grok AI"""
+    def _already_in(self, text, lang):
+        """True when text is detectably in lang already, so translating it is a no-op"""
+        return SKIP_NOOP_TRANSLATION and self.detect_language(text[:200]) == lang
+    
+    def _grok_messages(self, result, question):
+        """Build the Grok prompt from the wisdom analysis"""
         consensus = [t.value for t in result.consensus_traditions]
         confidence = result.confidence
         
@@ -146,14 +254,80 @@ A question was asked. The wisdom oracle analysis shows:
 Question: {question}
 
 Respond wisely, naturally, and in a way that honors all traditions."""
-        
-        response = self.client.chat.completions.create(
+        return [{"role": "user", "content": prompt}]
+    
+    def _grok_completion(self, messages, **kwargs):
+        """Call Grok directly or through the shared dispatcher"""
+        if self.dispatcher is not None:
+            return self.dispatcher.submit(self.client, self.model, messages, temperature=0.7, **kwargs)
+        return self.client.chat.completions.create(
             model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7
+            messages=messages,
+            temperature=0.7,
+            **kwargs
         )
+    
+    def _generate_grok_response(self, result, question):
+        """Generate response using Grok AI"""
+        response = self._grok_completion(self._grok_messages(result, question))
         return response.choices[0].message.content
     
+    def _generate_grok_translated(self, result, question, target_lang):
+        """
+        Stream a Grok response and translate each finished sentence while the
+        rest is still being generated.
+        
+        Returns:
+            tuple: (english_response, translated_response)
+        """
+        stream = self._grok_completion(self._grok_messages(result, question), stream=True)
+        
+        parts = []       # English deltas
+        pending = ""     # English text not yet sent for translation
+        translations = []  # (future, trailing whitespace) in answer order
+        
+        passthrough = None  # decided from the first finished text
+        
+        def submit(text):
+            nonlocal passthrough
+            if passthrough is None:
+                passthrough = self._already_in(text, target_lang)
+            if passthrough:
+                translations.append((None, text))
+                return
+            body = text.rstrip()
+            translations.append((
+                self._translate_pool.submit(self.translate, body, 'en', target_lang),
+                text[len(body):]
+            ))
+        
+        for event in stream:
+            if not event.choices:
+                continue
+            delta = event.choices[0].delta.content or ""
+            if not delta:
+                continue
+            parts.append(delta)
+            pending += delta
+            
+            # Hand off everything up to the last sentence boundary
+            boundary = None
+            for boundary in _SENTENCE_END.finditer(pending):
+                pass
+            if boundary is not None:
+                submit(pending[:boundary.end()])
+                pending = pending[boundary.end():]
+        
+        if pending.strip():
+            submit(pending)
+        
+        english_response = "".join(parts)
+        translated = "".join(
+            tail if future is None else future.result() + tail
+            for future, tail in translations
+        )
+        return english_response, translated.rstrip()
+    
     def _generate_rule_response(self, result, question):
         """Original rule-based response generation"""
         # [Your existing _generate_response code here]
@@ -168,15 +342,11 @@ Respond wisely, naturally, and in a way that honors all traditions."""
     def _extract_principles(self, text):
         """Extract wisdom principles from text"""
         # [Your existing _extract_principles code here]
-        principles = []
-        keyword_map = {
-            "justice": ["justice", "fair", "rights"],
-            "compassion": ["compassion", "kind", "mercy"],
-            "stewardship": ["stewardship", "environment", "earth"],
-        }
-        for principle, keywords in keyword_map.items():
-            if any(k in text.lower() for k in keywords):
-                principles.append(principle)
+        # One scan finds every keyword; the lookahead also reports matches
+        # that overlap or sit inside longer words ("unfair", "kindness")
+        found = {self._KEYWORD_PRINCIPLE[m.group(1)]
+                 for m in self._KEYWORD_RE.finditer(text.lower())}
+        principles = [p for p in self.KEYWORD_MAP if p in found]
         return principles or ["wisdom"]
     
     def chat(self):
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# conversation_log.py - Columnar conversation history for the oracles
+
+"""
+Conversation history stored as parallel columns instead of one dict per turn.
+Confidences and timestamps live in packed float arrays, and per-language
+statistics run over the columns without building a dict for every turn.
+"""
+
+import time
+from array import array
+
+
+class ConversationLog:
+    """
+    Append-only conversation history kept as parallel columns.
+
+    Indexing or iterating yields the familiar per-turn dicts, so callers
+    that read `conversation_history[-1]['answer']` keep working.
+    """
+
+    __slots__ = ("questions", "languages", "answers", "confidences", "timestamps")
+
+    def __init__(self):
+        self.questions = []
+        self.languages = []
+        self.answers = []
+        self.confidences = array('d')
+        self.timestamps = array('d')
+
+    def append(self, question, language, answer, confidence, timestamp=None):
+        """Record one turn of conversation"""
+        self.questions.append(question)
+        self.languages.append(language)
+        self.answers.append(answer)
+        self.confidences.append(confidence)
+        self.timestamps.append(time.time() if timestamp is None else timestamp)
+
+    def __len__(self):
+        return len(self.questions)
+
+    def __getitem__(self, index):
+        return {
+            'question': self.questions[index],
+            'language': self.languages[index],
+            'answer': self.answers[index],
+            'confidence': self.confidences[index],
+            'timestamp': self.timestamps[index]
+        }
+
+    def __iter__(self):
+        for index in range(len(self.questions)):
+            yield self[index]
+
+    def mean_confidence_by_language(self):
+        """
+        Average oracle confidence for each language seen so far.
+
+        Returns:
+            Dict mapping language code to mean confidence
+        """
+        totals = {}
+        counts = {}
+        for language, confidence in zip(self.languages, self.confidences):
+            totals[language] = totals.get(language, 0.0) + confidence
+            counts[language] = counts.get(language, 0) + 1
+        return {language: totals[language] / counts[language] for language in totals}
@@ -6,8 +6,18 @@ Reuses your existing AI agent infrastructure and smart contracts
 
 import os
 import json
+import hashlib
 import logging
+import orjson
 import requests
+import threading
+import time
+from decimal import Decimal
+from itertools import islice
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from web3 import Web3
 from dotenv import load_dotenv
 
@@ -20,6 +30,54 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("IntegrationAgent")
 
+# Maximum Wisdom Oracle reviews in flight at once (provider rate limits)
+WISDOM_REVIEW_CONCURRENCY = 5
+
+# Maximum concurrent IPFS uploads
+IPFS_UPLOAD_CONCURRENCY = 8
+
+# Largest page the Shopify REST orders endpoint returns
+SHOPIFY_PAGE_LIMIT = 250
+
+# Largest page Stripe list endpoints return
+STRIPE_PAGE_LIMIT = 100
+
+# Pause before the next Shopify call once its leaky bucket is this full
+SHOPIFY_THROTTLE_RATIO = 0.9
+SHOPIFY_THROTTLE_PAUSE = 0.5
+
+
+def _make_session(pool_connections=4, pool_maxsize=10):
+    """
+    Keep-alive HTTP session with connection pooling and retries on
+    rate limits and transient server errors.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        # Retry-After on 429/503 takes precedence over the exponential backoff
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _did_hash(value, digest_size=16):
+    """
+    Deterministic hex fingerprint for identifiers.
+    
+    Built-in hash() is salted per process (PYTHONHASHSEED), so DIDs derived
+    from it changed on every restart; blake2b gives the same value everywhere.
+    """
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=digest_size).hexdigest()
+
 class IntegrationAgent(MarketplaceAgent):
     """
     Integrates existing websites/companies with your DAO ecosystem.
@@ -33,6 +91,15 @@ class IntegrationAgent(MarketplaceAgent):
         # Initialize the base MarketplaceAgent first
         super().__init__()
         
+        # Persistent websocket to the node when available: one handshake
+        # for the whole transaction sequence instead of one per RPC
+        ws_url = os.getenv("WEB3_WS_URL")
+        if ws_url:
+            self.w3 = Web3(Web3.WebsocketProvider(ws_url))
+        
+        # Shared keep-alive HTTP session for all platform connectors
+        self._http = _make_session(pool_connections=20, pool_maxsize=20)
+        
         # Contract addresses
         self.entity_stack_address = os.getenv("ENTITY_STACK_ADDRESS")
         self.dao_template_address = os.getenv("DAO_TEMPLATE_ADDRESS")
@@ -49,6 +116,10 @@ class IntegrationAgent(MarketplaceAgent):
         # Connectors for external platforms
         self.connectors = {}
         
+        # Local nonce counter; fetched from the node once, then incremented
+        self._nonce = None
+        self._nonce_lock = threading.Lock()
+        
         # Wisdom Oracle for ethical validation
         self.wisdom_oracle = RecursiveWisdomOracle(
             api_key=os.getenv("XAI_API_KEY"),
@@ -66,13 +137,13 @@ class IntegrationAgent(MarketplaceAgent):
     
     def register_wordpress(self, site_url, username, password):
         """Connect to a WordPress site"""
-        self.connectors['wordpress'] = WordPressConnector(site_url, username, password)
+        self.connectors['wordpress'] = WordPressConnector(site_url, username, password, session=self._http)
         logger.info(f"📝 Connected to WordPress: {site_url}")
         return True
     
     def register_shopify(self, shop_url, api_key, password):
         """Connect to a Shopify store"""
-        self.connectors['shopify'] = ShopifyConnector(shop_url, api_key, password)
+        self.connectors['shopify'] = ShopifyConnector(shop_url, api_key, password, session=self._http)
         logger.info(f"🛍️ Connected to Shopify: {shop_url}")
         return True
     
@@ -103,28 +174,53 @@ class IntegrationAgent(MarketplaceAgent):
         # Get recent posts
         posts = wp.get_recent_posts(limit=10)
         
-        for post in posts:
-            # Create a proposal for each post
-            proposal = {
-                "title": f"Content Review: {post['title']}",
-                "description": post['excerpt'],
-                "content_hash": self._store_on_ipfs(post['content']),
-                "author_did": self._map_user_to_did(post['author_email']),
-                "timestamp": post['date']
-            }
-            
-            # Check with Wisdom Oracle
-            verdict = self.wisdom_oracle.analyze_question(
-                f"Should this content be approved? {post['title']}: {post['excerpt']}"
-            )
-            
-            if "approve" in verdict.lower():
-                # Submit to DAO
-                self._submit_proposal(dao_did, proposal)
-                logger.info(f"📄 Submitted post: {post['title']}")
+        # Start every IPFS upload at once, then review posts concurrently
+        # while the uploads are in flight; the oracle call dominates each one
+        with ThreadPoolExecutor(max_workers=IPFS_UPLOAD_CONCURRENCY) as ipfs_pool, \
+                ThreadPoolExecutor(max_workers=WISDOM_REVIEW_CONCURRENCY) as pool:
+            uploads = [ipfs_pool.submit(self._store_on_ipfs, post['content']) for post in posts]
+            futures = [
+                pool.submit(self._review_and_submit, dao_did, post, upload)
+                for post, upload in zip(posts, uploads)
+            ]
+        for post, future in zip(posts, futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Review failed for post {post['title']}: {e}")
         
         return True
     
+    def _review_and_submit(self, dao_did, post, content_upload):
+        """
+        Check one post with the Wisdom Oracle and submit it if approved.
+        
+        Args:
+            dao_did: DAO receiving the proposal
+            post: Post dict from WordPressConnector
+            content_upload: Future resolving to the post's IPFS hash
+        """
+        # Check with Wisdom Oracle
+        verdict = self.wisdom_oracle.analyze_question(
+            f"Should this content be approved? {post['title']}: {post['excerpt']}"
+        )
+        
+        # Create a proposal for each post
+        proposal = {
+            "title": f"Content Review: {post['title']}",
+            "description": post['excerpt'],
+            "content_hash": content_upload.result(),
+            "author_did": self._map_user_to_did(post['author_email']),
+            "timestamp": post['date']
+        }
+        
+        if "approve" in verdict.lower():
+            # Submit to DAO
+            self._submit_proposal(dao_did, proposal)
+            logger.info(f"📄 Submitted post: {post['title']}")
+            return True
+        return False
+    
     def sync_shopify_to_dao(self, dao_did):
         """Sync Shopify products and orders to DAO treasury"""
         if 'shopify' not in self.connectors:
@@ -136,9 +232,13 @@ class IntegrationAgent(MarketplaceAgent):
         # Get recent orders
         orders = shopify.get_recent_orders(limit=20)
         
-        total_revenue = 0
+        # One pass; revenue is summed in exact cents (Shopify sends decimal strings)
+        total_cents = 0
+        products_sold = 0
         for order in orders:
-            total_revenue += float(order['total_price'])
+            total_cents += int(Decimal(order['total_price']) * 100)
+            products_sold += len(order['line_items'])
+        total_revenue = total_cents / 100
         
         # Create treasury report
         report = {
@@ -146,7 +246,7 @@ class IntegrationAgent(MarketplaceAgent):
             "period": "last_30_days",
             "revenue": total_revenue,
             "order_count": len(orders),
-            "products_sold": sum(len(o['line_items']) for o in orders)
+            "products_sold": products_sold
         }
         
         # Store report on IPFS
@@ -154,22 +254,70 @@ class IntegrationAgent(MarketplaceAgent):
         
         # Update DAO treasury via smart contract
         if self.entity_stack:
-            txn = self.entity_stack.functions.updateTreasury(
-                dao_did,
-                report_hash,
-                int(total_revenue * 100)  # Convert to cents/wei
-            ).build_transaction({
+            self._transact(
+                self.entity_stack.functions.updateTreasury(
+                    dao_did,
+                    report_hash,
+                    total_cents  # Cents/wei
+                ),
+                gas=200000
+            )
+            logger.info(f"💰 Updated treasury with {total_revenue} revenue")
+        
+        return True
+    
+    def _next_nonce(self):
+        """Next nonce for the agent account, without an RPC round trip per transaction"""
+        with self._nonce_lock:
+            if self._nonce is None:
+                self._nonce = self.w3.eth.get_transaction_count(self.agent_address, "pending")
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+    
+    def _reset_nonce(self):
+        """Forget the local nonce so the next transaction re-reads it from the node"""
+        with self._nonce_lock:
+            self._nonce = None
+    
+    def _transact(self, contract_call, gas):
+        """Build a contract call from the agent account with the next nonce and send it"""
+        try:
+            txn = contract_call.build_transaction({
                 'from': self.agent_address,
-                'nonce': self.w3.eth.get_transaction_count(self.agent_address),
-                'gas': 200000,
+                'nonce': self._next_nonce(),
+                'gas': gas,
                 'gasPrice': self.w3.eth.gas_price
             })
-            
+        except Exception:
+            # The nonce was taken but nothing was sent; reusing the counter would leave a gap
+            self._reset_nonce()
+            raise
+        return self._send_transaction(txn)
+    
+    def _send_transaction(self, txn):
+        """
+        Sign and send a transaction, re-syncing the nonce once if the node rejects it.
+        
+        Any failed send resets the local nonce, so a transaction that never reached
+        the node does not leave a gap that stalls every later one.
+        """
+        try:
             signed = self.w3.eth.account.sign_transaction(txn, self.private_key)
-            self.w3.eth.send_raw_transaction(signed.rawTransaction)
-            logger.info(f"💰 Updated treasury with {total_revenue} revenue")
+            return self.w3.eth.send_raw_transaction(signed.rawTransaction)
+        except Exception as e:
+            self._reset_nonce()
+            if "nonce" not in str(e).lower():
+                raise
+            logger.warning(f"Nonce rejected ({e}), re-syncing from node")
         
-        return True
+        txn['nonce'] = self._next_nonce()
+        try:
+            signed = self.w3.eth.account.sign_transaction(txn, self.private_key)
+            return self.w3.eth.send_raw_transaction(signed.rawTransaction)
+        except Exception:
+            self._reset_nonce()
+            raise
     
     def _store_on_ipfs(self, content):
         """Store content on IPFS using inherited method"""
@@ -178,7 +326,7 @@ class IntegrationAgent(MarketplaceAgent):
     def _map_user_to_did(self, email):
         """Map external user email to Zialiel DID"""
         # Simple mapping – in production, use DID registry
-        return f"did:zialiel:user:{hash(email)}"
+        return f"did:zialiel:user:{_did_hash(email)}"
     
     def _submit_proposal(self, dao_did, proposal):
         """Submit proposal to DAO governance"""
@@ -206,23 +354,18 @@ class IntegrationAgent(MarketplaceAgent):
             return False
         
         # Create DID for the company
-        company_did = f"did:zialiel:company:{hash(company_name)}"
+        company_did = f"did:zialiel:company:{_did_hash(company_name)}"
         
         # Register on EntityStack
-        txn = self.entity_stack.functions.registerEntity(
-            company_did,
-            company_name,
-            jurisdiction,
-            operating_agreement_ipfs
-        ).build_transaction({
-            'from': self.agent_address,
-            'nonce': self.w3.eth.get_transaction_count(self.agent_address),
-            'gas': 300000,
-            'gasPrice': self.w3.eth.gas_price
-        })
-        
-        signed = self.w3.eth.account.sign_transaction(txn, self.private_key)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.rawTransaction)
+        tx_hash = self._transact(
+            self.entity_stack.functions.registerEntity(
+                company_did,
+                company_name,
+                jurisdiction,
+                operating_agreement_ipfs
+            ),
+            gas=300000
+        )
         receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
         
         if receipt.status == 1:
@@ -237,18 +380,13 @@ class IntegrationAgent(MarketplaceAgent):
         if not self.entity_stack:
             return False
         
-        txn = self.entity_stack.functions.linkToDAO(
-            company_did,
-            dao_address
-        ).build_transaction({
-            'from': self.agent_address,
-            'nonce': self.w3.eth.get_transaction_count(self.agent_address),
-            'gas': 150000,
-            'gasPrice': self.w3.eth.gas_price
-        })
-        
-        signed = self.w3.eth.account.sign_transaction(txn, self.private_key)
-        self.w3.eth.send_raw_transaction(signed.rawTransaction)
+        self._transact(
+            self.entity_stack.functions.linkToDAO(
+                company_did,
+                dao_address
+            ),
+            gas=150000
+        )
         logger.info(f"🔗 Company {company_did} linked to DAO {dao_address}")
         return True
     
@@ -267,10 +405,10 @@ class IntegrationAgent(MarketplaceAgent):
         logger.info(f"🚀 Starting integration for {business_data['name']}")
         
         # Step 1: Connect platforms
-        if 'wordpress' in business_data:
+        if business_data.get('wordpress'):
             self.register_wordpress(**business_data['wordpress'])
         
-        if 'shopify' in business_data:
+        if business_data.get('shopify'):
             self.register_shopify(**business_data['shopify'])
         
         # Step 2: Create DAO (using your future DAOTemplate.sol)
@@ -287,12 +425,21 @@ class IntegrationAgent(MarketplaceAgent):
         if company_did and dao_address:
             self.link_company_to_dao(company_did, dao_address)
         
-        # Step 5: Sync initial data
-        if 'wordpress' in business_data:
-            self.sync_wordpress_to_dao(company_did)
-        
-        if 'shopify' in business_data:
-            self.sync_shopify_to_dao(company_did)
+        # Step 5: Sync initial data (independent network round trips, run together)
+        syncs = []
+        if business_data.get('wordpress'):
+            syncs.append(self.sync_wordpress_to_dao)
+        if business_data.get('shopify'):
+            syncs.append(self.sync_shopify_to_dao)
+        
+        if syncs:
+            with ThreadPoolExecutor(max_workers=len(syncs)) as pool:
+                futures = [pool.submit(sync, company_did) for sync in syncs]
+            for sync, future in zip(syncs, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"{sync.__name__} failed: {e}")
         
         logger.info(f"✅ Integration complete for {business_data['name']}")
         return {
@@ -305,15 +452,34 @@ class IntegrationAgent(MarketplaceAgent):
         """Create a new DAO (placeholder – will use your DAOTemplate.sol)"""
         logger.info(f"🏛️ Creating DAO: {name}")
         # This will call your DAOTemplate.sol when deployed
-        return f"0x{hash(name)}"  # Placeholder
+        return f"0x{_did_hash(name, digest_size=20)}"  # Placeholder (20-byte address)
 
 
 # ============================================================
 # PLATFORM CONNECTORS
 # ============================================================
 
-class WordPressConnector:
-    def __init__(self, site_url, username, password):
+class _PooledConnector:
+    """Connector base owning a pooled session unless one is shared in"""
+    
+    def __init__(self, session=None):
+        self._owns_session = session is None
+        self.session = session or _make_session()
+    
+    def close(self):
+        """Close the session if this connector created it"""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+class WordPressConnector(_PooledConnector):
+    def __init__(self, site_url, username, password, session=None):
+        super().__init__(session)
         self.site_url = site_url.rstrip('/')
         self.auth = (username, password)
         self.api_base = f"{self.site_url}/wp-json/wp/v2"
@@ -321,21 +487,26 @@ class WordPressConnector:
     def get_recent_posts(self, limit=10):
         """Get recent WordPress posts"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/posts",
-                params={"per_page": limit, "status": "publish"},
+                params={
+                    "per_page": limit,
+                    "status": "publish",
+                    # Only the fields we map; the rest of a post is never read
+                    "_fields": "id,title,excerpt,content,date,author"
+                },
                 auth=self.auth
             )
             response.raise_for_status()
             
+            raw_posts = orjson.loads(response.content)
+            
+            # All distinct authors in one request instead of one per post
+            authors = self._get_authors({post['author'] for post in raw_posts})
+            
             posts = []
-            for post in response.json():
-                # Get author email
-                author_response = requests.get(
-                    f"{self.api_base}/users/{post['author']}",
-                    auth=self.auth
-                )
-                author = author_response.json() if author_response.ok else {"email": "unknown"}
+            for post in raw_posts:
+                author = authors.get(post['author'], {"email": "unknown"})
                 
                 posts.append({
                     "id": post['id'],
@@ -349,24 +520,53 @@ class WordPressConnector:
         except Exception as e:
             logger.error(f"WordPress API error: {e}")
             return []
+    
+    def _get_authors(self, author_ids):
+        """Fetch WordPress users by id with a single include= query"""
+        if not author_ids:
+            return {}
+        response = self.session.get(
+            f"{self.api_base}/users",
+            params={
+                "include": ",".join(map(str, sorted(author_ids))),
+                "per_page": len(author_ids),
+                "_fields": "id,email"
+            },
+            auth=self.auth
+        )
+        if not response.ok:
+            return {}
+        return {user['id']: user for user in orjson.loads(response.content)}
 
-class ShopifyConnector:
-    def __init__(self, shop_url, api_key, password):
+class ShopifyConnector(_PooledConnector):
+    def __init__(self, shop_url, api_key, password, session=None):
+        super().__init__(session)
         self.shop_url = shop_url.rstrip('/')
         self.auth = (api_key, password)
     
     def get_recent_orders(self, limit=20):
         """Get recent Shopify orders"""
         try:
-            response = requests.get(
-                f"https://{self.shop_url}/admin/api/2024-01/orders.json",
-                params={"status": "any", "limit": limit},
-                auth=self.auth
-            )
-            response.raise_for_status()
+            url = f"https://{self.shop_url}/admin/api/2024-01/orders.json"
+            params = {
+                "status": "any",
+                "limit": min(limit, SHOPIFY_PAGE_LIMIT),
+                # Only the fields we keep; full orders are several KB each
+                "fields": "id,total_price,currency,created_at,line_items"
+            }
+            
+            raw_orders = []
+            while url and len(raw_orders) < limit:
+                response = self.session.get(url, params=params, auth=self.auth)
+                response.raise_for_status()
+                raw_orders.extend(orjson.loads(response.content).get('orders', []))
+                self._throttle(response)
+                # Cursor pagination: the next link already carries the query
+                url = response.links.get('next', {}).get('url')
+                params = None
             
             orders = []
-            for order in response.json().get('orders', []):
+            for order in raw_orders[:limit]:
                 orders.append({
                     "id": order['id'],
                     "total_price": order['total_price'],
@@ -378,6 +578,19 @@ class ShopifyConnector:
         except Exception as e:
             logger.error(f"Shopify API error: {e}")
             return []
+    
+    @staticmethod
+    def _throttle(response):
+        """Back off while the shop's API call bucket (e.g. "38/40") is nearly full"""
+        call_limit = response.headers.get('X-Shopify-Shop-Api-Call-Limit')
+        if not call_limit:
+            return
+        try:
+            used, capacity = map(int, call_limit.split('/'))
+        except ValueError:
+            return
+        if capacity and used / capacity > SHOPIFY_THROTTLE_RATIO:
+            time.sleep(SHOPIFY_THROTTLE_PAUSE)
 
 class QuickBooksConnector:
     def __init__(self, client_id, client_secret, refresh_token):
@@ -391,8 +604,13 @@ class QuickBooksConnector:
         # OAuth2 token refresh logic here
         pass
 
-class StripeConnector:
-    def __init__(self, api_key):
+class StripeConnector(_PooledConnector):
+    FIELDS = ("id", "amount", "currency", "created", "customer", "description")
+    _field_values = staticmethod(itemgetter(*FIELDS))
+    API_BASE = "https://api.stripe.com/v1"
+    
+    def __init__(self, api_key, session=None):
+        super().__init__(session)
         self.api_key = api_key
         import stripe
         stripe.api_key = api_key
@@ -401,15 +619,46 @@ class StripeConnector:
     def get_recent_transactions(self, limit=20):
         """Get recent Stripe transactions"""
         try:
-            charges = self.stripe.Charge.list(limit=limit)
-            return [{
-                "id": c.id,
-                "amount": c.amount / 100,  # Convert cents to dollars
-                "currency": c.currency,
-                "created": c.created,
-                "customer": c.customer,
-                "description": c.description
-            } for c in charges.data]
+            # Stripe pages hold at most 100 charges; the iterator follows
+            # the cursor for larger limits instead of erroring out
+            charges = self.stripe.Charge.list(limit=min(limit, STRIPE_PAGE_LIMIT))
+            transactions = []
+            for charge in islice(charges.auto_paging_iter(), limit):
+                # StripeObject is a dict: one C-level lookup for all fields
+                transaction = dict(zip(self.FIELDS, self._field_values(charge)))
+                transaction["amount"] /= 100  # Convert cents to dollars
+                transactions.append(transaction)
+            return transactions
+        except Exception as e:
+            logger.error(f"Stripe error: {e}")
+            return []
+    
+    def get_recent_transactions_fast(self, limit=20):
+        """
+        Get recent Stripe transactions straight from the REST API.
+        
+        Same rows as get_recent_transactions, but the JSON is decoded with
+        orjson into plain dicts instead of wrapping each charge in a
+        StripeObject.
+        """
+        try:
+            params = {"limit": min(limit, STRIPE_PAGE_LIMIT)}
+            transactions = []
+            while len(transactions) < limit:
+                response = self.session.get(
+                    f"{self.API_BASE}/charges", params=params, auth=(self.api_key, "")
+                )
+                response.raise_for_status()
+                page = orjson.loads(response.content)
+                charges = page.get("data", [])
+                for charge in charges[:limit - len(transactions)]:
+                    transaction = dict(zip(self.FIELDS, self._field_values(charge)))
+                    transaction["amount"] /= 100  # Convert cents to dollars
+                    transactions.append(transaction)
+                if not page.get("has_more") or not charges:
+                    break
+                params = {"limit": params["limit"], "starting_after": charges[-1]["id"]}
+            return transactions
         except Exception as e:
             logger.error(f"Stripe error: {e}")
             return []
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# llm_dispatch.py - Shared rate limiting and retries for oracle LLM calls
+
+"""
+One LLMDispatcher can be shared by every oracle in a process so that, together,
+they stay under the provider's requests-per-minute and tokens-per-minute limits
+instead of each hammering the API and failing with 429s.
+"""
+
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger("LLMDispatcher")
+
+# HTTP status codes worth retrying: rate limited or transient server errors
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at capacity-per-minute.
+    """
+
+    def __init__(self, capacity_per_minute):
+        self.capacity = float(capacity_per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount=1):
+        """Block until `amount` tokens are available, then consume them"""
+        # A single request larger than the bucket would otherwise wait forever
+        amount = min(float(amount), self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.available >= amount:
+                    self.available -= amount
+                    return
+                wait = (amount - self.available) / self.rate
+            time.sleep(wait)
+
+
+class LLMDispatcher:
+    """
+    Rate-limited, retrying front door for chat completion calls.
+
+    Args:
+        max_requests_per_minute: Request budget shared by all callers
+        max_tokens_per_minute: Token budget shared by all callers
+        max_attempts: Attempts per call before the last error is raised
+    """
+
+    def __init__(self, max_requests_per_minute=60, max_tokens_per_minute=100_000, max_attempts=5):
+        self.requests = TokenBucket(max_requests_per_minute)
+        self.tokens = TokenBucket(max_tokens_per_minute)
+        self.max_attempts = max_attempts
+
+    @staticmethod
+    def estimate_tokens(messages, max_tokens=None):
+        """Rough token cost of a call: ~4 characters per prompt token plus the reply budget"""
+        prompt = sum(len(m.get("content") or "") for m in messages) // 4
+        return prompt + (max_tokens or 1000)
+
+    def submit(self, client, model, messages, **kwargs):
+        """
+        Send a chat completion through the shared limits.
+
+        Args:
+            client: OpenAI-compatible client to call
+            model: Model name
+            messages: Chat messages
+            **kwargs: Passed through to chat.completions.create
+
+        Returns:
+            The client's response (or stream when stream=True)
+        """
+        cost = self.estimate_tokens(messages, kwargs.get("max_tokens"))
+
+        for attempt in range(1, self.max_attempts + 1):
+            self.requests.acquire()
+            self.tokens.acquire(cost)
+            try:
+                return client.chat.completions.create(model=model, messages=messages, **kwargs)
+            except Exception as e:
+                status = getattr(e, "status_code", None)
+                if status not in RETRYABLE_STATUS or attempt == self.max_attempts:
+                    raise
+                backoff = min(60, 2 ** attempt + random.random())
+                logger.warning(f"LLM call failed with {status}, retrying in {backoff:.1f}s "
+                               f"(attempt {attempt}/{self.max_attempts})")
+                time.sleep(backoff)
@@ -1,15 +1,202 @@
-python
 # oracle_multilingual.py
 """
 A multilingual interface for the Wisdom Oracle.
 Speak in any language, receive wisdom in the same language.
 """
 
-from wisdom_oracle import WisdomOracle
+from shared_wisdom import get_wisdom_oracle
+from conversation_log import ConversationLog
 from deep_translator import GoogleTranslator
-import time
+import bisect
+import functools
+import re
 import random
 
+try:
+    # langdetect is optional but much more accurate than the script check
+    from langdetect import detect as _langdetect
+except ImportError:
+    _langdetect = None
+
+
+# English-only function words used to recognise plain English questions
+_ENGLISH_MARKERS = frozenset({
+    'the', 'what', 'how', 'why', 'should', 'would', 'could', 'and', 'my',
+    'you', 'your', 'with', 'this', 'that', 'does', 'can', 'when', 'where',
+    'which', 'who', 'about', 'are'
+})
+_ASCII_WORD = re.compile(r"[a-z']+")
+
+
+def _looks_english(text):
+    """True for ASCII text with at least two distinct English function words"""
+    if not text.isascii():
+        return False
+    words = _ASCII_WORD.findall(text.lower())
+    if len(words) < 3:
+        return False
+    hits = sum(1 for word in words if word in _ENGLISH_MARKERS)
+    return len(_ENGLISH_MARKERS.intersection(words)) >= 2 and hits * 4 >= len(words)
+
+
+@functools.lru_cache(maxsize=2048)
+def _detect_language(text):
+    """
+    Detect the language of the input text
+    
+    Args:
+        text: The text to detect language for
+        
+    Returns:
+        Language code (e.g., 'no', 'en', 'ar')
+    """
+    if _looks_english(text):
+        return 'en'
+    if _langdetect is not None:
+        try:
+            return _langdetect(text)
+        except Exception:
+            pass
+    
+    # Fallback: Simple detection based on character sets
+    if any(ord(c) > 0x4e00 and ord(c) < 0x9fff for c in text):
+        return 'zh-cn'  # Chinese
+    if any(ord(c) > 0x0600 and ord(c) < 0x06FF for c in text):
+        return 'ar'  # Arabic
+    if any(ord(c) > 0x0400 and ord(c) < 0x04FF for c in text):
+        return 'ru'  # Russian
+    
+    # Default to English
+    return 'en'
+
+
+@functools.lru_cache(maxsize=None)
+def _get_translator(source, target):
+    """One GoogleTranslator per language pair"""
+    return GoogleTranslator(source=source, target=target)
+
+
+@functools.lru_cache(maxsize=4096)
+def _translate_cached(source, target, text):
+    """Translate text; identical requests are served from memory"""
+    return _get_translator(source, target).translate(text)
+
+
+# Principle -> keywords that signal it (substring match on lowercased text)
+PRINCIPLE_KEYWORDS = {
+    "justice": ("justice", "fair", "right", "equality", "discrimination", "unfair"),
+    "compassion": ("compassion", "kind", "mercy", "forgive", "forgiveness", "help", "care", "gentle"),
+    "stewardship": ("stewardship", "environment", "nature", "earth", "future", "generation", "planet", "sustainable"),
+    "freedom": ("freedom", "liberty", "choice", "autonomy", "free", "independent"),
+    "community": ("community", "together", "share", "collective", "society", "fellowship", "neighbor"),
+    "truth": ("truth", "honest", "real", "authentic", "wisdom", "knowledge"),
+    "gratitude": ("gratitude", "thank", "grateful", "appreciation", "blessing"),
+    "dignity": ("dignity", "respect", "honor", "value", "worth", "sacred"),
+    "love": ("love", "beloved", "cherish", "affection", "heart"),
+    "peace": ("peace", "calm", "serenity", "harmony", "tranquil"),
+    "hope": ("hope", "faith", "trust", "belief", "optimism"),
+    "courage": ("courage", "brave", "strength", "fear", "doubt")
+}
+
+
+def _build_keyword_scanner(keyword_map):
+    """
+    Compile all keywords into one regex pass.
+    
+    The lookahead finds the longest keyword starting at every position; each
+    keyword maps to the principles of every keyword it contains, so shorter
+    keywords hidden inside a longer match ("free" in "freedom", "fair" in
+    "unfair") are still counted, exactly like a per-keyword substring test.
+    """
+    owners = {}
+    for principle, keywords in keyword_map.items():
+        for keyword in keywords:
+            owners.setdefault(keyword, set()).add(principle)
+    
+    implied = {
+        keyword: frozenset(p for other, ps in owners.items() if other in keyword for p in ps)
+        for keyword in owners
+    }
+    alternation = "|".join(re.escape(k) for k in sorted(owners, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), implied
+
+
+_KEYWORD_RE, _KEYWORD_PRINCIPLES = _build_keyword_scanner(PRINCIPLE_KEYWORDS)
+
+
+# Keywords are plain letters, so no keyword match can cross a non-letter
+_WORD = re.compile(r"[a-z]+")
+
+
+# Bit i stands for the i-th principle, so a word's principles are one int
+_PRINCIPLE_ORDER = tuple(PRINCIPLE_KEYWORDS)
+_PRINCIPLE_BIT = {p: 1 << i for i, p in enumerate(_PRINCIPLE_ORDER)}
+
+
+@functools.lru_cache(maxsize=8192)
+def _word_principles(word):
+    """Bitmask of principles implied by every keyword inside one word ("unfairness" -> justice)"""
+    mask = 0
+    for match in _KEYWORD_RE.finditer(word):
+        for principle in _KEYWORD_PRINCIPLES[match.group(1)]:
+            mask |= _PRINCIPLE_BIT[principle]
+    return mask
+
+
+@functools.lru_cache(maxsize=None)
+def _principles_for_mask(mask):
+    """Decode a principle bitmask into names, in PRINCIPLE_KEYWORDS order"""
+    return tuple(p for i, p in enumerate(_PRINCIPLE_ORDER) if mask >> i & 1)
+
+
+@functools.lru_cache(maxsize=4096)
+def _scan_principles(text):
+    """Principles whose keywords occur in text, in PRINCIPLE_KEYWORDS order"""
+    # Reverse index by word: each distinct word is scanned once per process,
+    # after that a question costs one cached lookup and an OR per word
+    mask = 0
+    for word in set(_WORD.findall(text.lower())):
+        mask |= _word_principles(word)
+    
+    return _principles_for_mask(mask)
+
+# Confidence cut-offs between the response templates below
+_CONFIDENCE_CUTS = (0.4, 0.6, 0.8)
+
+# Response templates, from low alignment to strong alignment
+_RESPONSE_TEMPLATES = (
+    # Low alignment
+    """⚠️ The traditions counsel careful reconsideration.
+
+Only {con_count} of 7 traditions see alignment here. The majority express concern: {dis_top3}.
+
+This may not be the right path, or perhaps the question needs to be reframed. Sit with this in stillness.
+{quote_text}""",
+    # Mixed signals
+    """🌙 The traditions are divided on this question.
+
+Some see wisdom here: {con_top2}.
+Others urge caution: {dis_top2_or_several}.
+
+This suggests a need for deeper reflection. Consider both perspectives before deciding.
+{quote_text}""",
+    # Moderate alignment
+    """🕊️ There is general agreement among the traditions, though with some nuance.
+
+{con_count} traditions support this: {con_top3}{con_more}.
+{dis_count} tradition{dis_plural} {dis_verb} reservations: {dis_top2}.
+
+This is a good path, but proceed with awareness of the cautions raised.
+{quote_text}""",
+    # Strong alignment
+    """✨ The wisdom traditions speak with one voice on this matter.
+
+{con_count} of 7 traditions are in strong agreement: {con_top3}{con_more}.
+
+The path forward is clear. Trust in this alignment and move forward with confidence.
+{quote_text}"""
+)
+
 class MultilingualOracle:
     """
     A Wisdom Oracle that understands and responds in any language.
@@ -18,7 +205,7 @@ class MultilingualOracle:
     
     def __init__(self):
         # Your original wisdom oracle (7 traditions)
-        self.wisdom = WisdomOracle()
+        self.wisdom = get_wisdom_oracle()
         
         # Google Translate client (deep_translator version)
         self.translator = GoogleTranslator()
@@ -71,7 +258,7 @@ class MultilingualOracle:
         }
         
         # Conversation history
-        self.conversation_history = []
+        self.conversation_history = ConversationLog()
         
         print("\n" + "★" * 60)
         print("🌍 THE MULTILINGUAL WISDOM ORACLE".center(58))
@@ -81,38 +268,34 @@ class MultilingualOracle:
         print(f"🇳🇴 You can speak Norwegian, English, Arabic, Chinese...")
     
     def detect_language(self, text):
-    """
-    Detect the language of the input text
-    
-    Args:
-        text: The text to detect language for
+        """
+        Detect the language of the input text (cached per text)
         
-    Returns:
-        Language code (e.g., 'no', 'en', 'ar')
-    """
-    try:
-        # Try using langdetect if available (much more accurate)
-        from langdetect import detect
-        return detect(text)
-    except ImportError:
-        # Fall back to character detection
-        pass
-    except:
-        pass
+        Args:
+            text: The text to detect language for
+            
+        Returns:
+            Language code (e.g., 'no', 'en', 'ar')
+        """
+        return _detect_language(text)
     
-    # Fallback: Simple detection based on character sets
-    try:
-        if any(ord(c) > 0x4e00 and ord(c) < 0x9fff for c in text):
-            return 'zh-cn'  # Chinese
-        if any(ord(c) > 0x0600 and ord(c) < 0x06FF for c in text):
-            return 'ar'  # Arabic
-        if any(ord(c) > 0x0400 and ord(c) < 0x04FF for c in text):
-            return 'ru'  # Russian
-    except:
-        pass
+    def detect_languages(self, texts):
+        """
+        Detect the language of several texts at once
+        
+        Args:
+            texts: List of texts
+            
+        Returns:
+            List of language codes, one per text
+        """
+        # Each distinct text is detected once, however often it repeats
+        detected = {text: _detect_language(text) for text in dict.fromkeys(texts)}
+        return [detected[text] for text in texts]
     
-    # Default to English
-    return 'en'
+    def _translate(self, text, source, target):
+        """Translate text through the shared LRU cache (raises on failure)"""
+        return _translate_cached(source, target, text)
     
     def get_language_name(self, lang_code):
         """Get the full language name from a language code"""
@@ -144,9 +327,7 @@ class MultilingualOracle:
         if source_lang != 'en':
             print("🔄 Translating your question to English...")
             try:
-                # Set up translator for source -> English
-                translator = GoogleTranslator(source=source_lang, target='en')
-                oracle_input = translator.translate(question)
+                oracle_input = self._translate(question, source_lang, 'en')
                 print(f"📝 English: \"{oracle_input[:100]}{'...' if len(oracle_input) > 100 else ''}\"")
             except Exception as e:
                 print(f"Translation error: {e}. Using original text.")
@@ -173,8 +354,7 @@ class MultilingualOracle:
         if source_lang != 'en':
             print(f"🔄 Translating response back to {source_lang_name}...")
             try:
-                translator_back = GoogleTranslator(source='en', target=source_lang)
-                final_response = translator_back.translate(english_response)
+                final_response = self._translate(english_response, 'en', source_lang)
             except Exception as e:
                 print(f"Translation error: {e}. Returning English response.")
                 final_response = english_response
@@ -182,40 +362,29 @@ class MultilingualOracle:
             final_response = english_response
         
         # Add to conversation history
-        self.conversation_history.append({
-            'question': question,
-            'language': source_lang,
-            'answer': final_response,
-            'confidence': result.confidence,
-            'timestamp': time.time()
-        })
+        self.conversation_history.append(
+            question, source_lang, final_response, result.confidence
+        )
         
         return final_response, result.confidence
     
+    def ask_batch(self, questions):
+        """
+        Ask several questions, detecting all their languages in one pass
+        
+        Args:
+            questions: List of questions in any language
+            
+        Returns:
+            List of (answer, confidence) tuples, one per question
+        """
+        languages = self.detect_languages(questions)
+        return [self.ask(question, target_lang=lang) for question, lang in zip(questions, languages)]
+    
     def _extract_principles(self, text):
         """Extract wisdom principles from the question text"""
-        text_lower = text.lower()
-        principles = []
-        
-        keyword_map = {
-            "justice": ["justice", "fair", "right", "equality", "discrimination", "unfair"],
-            "compassion": ["compassion", "kind", "mercy", "forgive", "forgiveness", "help", "care", "gentle"],
-            "stewardship": ["stewardship", "environment", "nature", "earth", "future", "generation", "planet", "sustainable"],
-            "freedom": ["freedom", "liberty", "choice", "autonomy", "free", "independent"],
-            "community": ["community", "together", "share", "collective", "society", "fellowship", "neighbor"],
-            "truth": ["truth", "honest", "real", "authentic", "wisdom", "knowledge"],
-            "gratitude": ["gratitude", "thank", "grateful", "appreciation", "blessing"],
-            "dignity": ["dignity", "respect", "honor", "value", "worth", "sacred"],
-            "love": ["love", "beloved", "cherish", "affection", "heart"],
-            "peace": ["peace", "calm", "serenity", "harmony", "tranquil"],
-            "hope": ["hope", "faith", "trust", "belief", "optimism"],
-            "courage": ["courage", "brave", "strength", "fear", "doubt"]
-        }
-        
-        for principle, keywords in keyword_map.items():
-            if any(k in text_lower for k in keywords):
-                if principle not in principles:
-                    principles.append(principle)
+        # Re-asked questions hit the cache instead of rescanning
+        principles = list(_scan_principles(text))
         
         # Default if no principles found
         if not principles:
@@ -237,44 +406,25 @@ class MultilingualOracle:
             q = quotes[0]
             quote_text = f"\n\nAs {q['tradition'].title()} wisdom reminds us:\n\"{q['quote']}\" — {q['source']}"
         
-        # Generate response based on confidence level
-        if confidence >= 0.8:
-            # Strong alignment
-            return f"""✨ The wisdom traditions speak with one voice on this matter.
-
-{len(consensus)} of 7 traditions are in strong agreement: {', '.join(consensus[:3])}{' and others' if len(consensus) > 3 else ''}.
-
-The path forward is clear. Trust in this alignment and move forward with confidence.
-{quote_text}"""
-        
-        elif confidence >= 0.6:
-            # Moderate alignment
-            return f"""🕊️ There is general agreement among the traditions, though with some nuance.
-
-{len(consensus)} traditions support this: {', '.join(consensus[:3])}{' and others' if len(consensus) > 3 else ''}.
-{len(dissenting)} tradition{'s' if len(dissenting) != 1 else ''} {'have' if len(dissenting) != 1 else 'has'} reservations: {', '.join(dissenting[:2])}.
-
-This is a good path, but proceed with awareness of the cautions raised.
-{quote_text}"""
-        
-        elif confidence >= 0.4:
-            # Mixed signals
-            return f"""🌙 The traditions are divided on this question.
-
-Some see wisdom here: {', '.join(consensus[:2]) if consensus else 'Few'}.
-Others urge caution: {', '.join(dissenting[:2]) if dissenting else 'Several'}.
-
-This suggests a need for deeper reflection. Consider both perspectives before deciding.
-{quote_text}"""
-        
-        else:
-            # Low alignment
-            return f"""⚠️ The traditions counsel careful reconsideration.
-
-Only {len(consensus)} of 7 traditions see alignment here. The majority express concern: {', '.join(dissenting[:3])}.
-
-This may not be the right path, or perhaps the question needs to be reframed. Sit with this in stillness.
-{quote_text}"""
+        # Every template field is computed once, then the confidence bucket
+        # picks the template
+        con_count = len(consensus)
+        dis_count = len(dissenting)
+        context = {
+            'con_count': con_count,
+            'dis_count': dis_count,
+            'con_top2': ', '.join(consensus[:2]) if consensus else 'Few',
+            'con_top3': ', '.join(consensus[:3]),
+            'con_more': ' and others' if con_count > 3 else '',
+            'dis_top2': ', '.join(dissenting[:2]),
+            'dis_top2_or_several': ', '.join(dissenting[:2]) if dissenting else 'Several',
+            'dis_top3': ', '.join(dissenting[:3]),
+            'dis_plural': 's' if dis_count != 1 else '',
+            'dis_verb': 'have' if dis_count != 1 else 'has',
+            'quote_text': quote_text
+        }
+        bucket = bisect.bisect_right(_CONFIDENCE_CUTS, confidence)
+        return _RESPONSE_TEMPLATES[bucket].format_map(context)
     
     def get_wisdom_quote(self, lang='en'):
         """Get a random wisdom quote, optionally translated"""
@@ -288,8 +438,7 @@ This may not be the right path, or perhaps the question needs to be reframed. Si
         # Translate if needed
         if lang != 'en':
             try:
-                translator = GoogleTranslator(source='en', target=lang)
-                translated = translator.translate(quote_text)
+                translated = self._translate(quote_text, 'en', lang)
                 return f"📜 {q['tradition'].upper()}: {translated}"
             except:
                 return f"📜 {q['tradition'].upper()}: {quote_text}"
@@ -317,16 +466,14 @@ This may not be the right path, or perhaps the question needs to be reframed. Si
                 continue
             
             print("\n🔮 Consulting the traditions...")
-            time.sleep(1)
             
             # Show a wisdom quote while thinking
             detected_lang = self.detect_language(question)
             print(self.get_wisdom_quote(detected_lang))
             print("🤔 Reflecting...")
-            time.sleep(1)
             
-            # Get answer
-            answer, confidence = self.ask(question)
+            # Get answer (reusing the language detected above)
+            answer, confidence = self.ask(question, target_lang=detected_lang)
             
             print(f"\n🕊️ Oracle: {answer}")
             print(f"\n(⚖️ Wisdom confidence: {confidence*100:.1f}%)")
@@ -2,10 +2,16 @@
 # self_improving_oracle.py - Learns from every interaction
 # Full integration with Grok, Wisdom Oracle, and persistent storage
 
-import json
 import os
+import atexit
 import logging
+import threading
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import orjson
 from dotenv import load_dotenv
 import openai
 
@@ -13,6 +19,36 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("SelfImprovingOracle")
 
+# Number of recent interactions kept in memory; older ones are read from disk
+RECENT_INTERACTIONS = 256
+
+# Log writes are buffered and written + fsynced together once this many
+# records are pending or FLUSH_INTERVAL seconds after the first one.
+# Keep FLUSH_RECORDS below RECENT_INTERACTIONS: unflushed interactions are
+# only readable from the in-memory ring.
+FLUSH_RECORDS = 32
+FLUSH_INTERVAL = 0.25
+
+# Lowest rating that makes an interaction a fine-tuning example
+GOOD_RATING = 4
+
+# Records written within this many nanoseconds share one timestamp string
+TIMESTAMP_RESOLUTION_NS = 10_000_000
+
+DEFAULT_SYSTEM_PROMPT = """You are a wise oracle embodying 7 spiritual traditions:
+- Christian: compassion, forgiveness, love
+- Buddhist: mindfulness, non-harm, compassion
+- Indigenous: seven generations, connection to earth
+- Humanist: dignity, reason, freedom
+- Islamic: mercy, justice, brotherhood
+- Judaic: learning, justice, community
+- Hindu: dharma, unity, non-attachment
+
+Answer wisely, kindly, and in the same language as the question."""
+
+# Shared by every default-prompt request; the client only reads it
+DEFAULT_SYSTEM_MESSAGE = {"role": "system", "content": DEFAULT_SYSTEM_PROMPT}
+
 class SelfImprovingOracle:
     """
     An oracle that learns from every interaction.
@@ -52,14 +88,63 @@ class SelfImprovingOracle:
         # Create storage directory if it doesn't exist
         os.makedirs(self.storage_path, exist_ok=True)
         
-        # Load existing data
-        self.interaction_log = self._load_json("interactions.json", [])
-        self.feedback_log = self._load_json("feedback.json", [])
-        self.corrections_log = self._load_json("corrections.json", [])
+        # Interactions are appended to a JSONL file; memory holds only the line
+        # offsets (interaction id -> byte offset) and the most recent entries
+        self._interactions_path = os.path.join(self.storage_path, "interactions.jsonl")
+        self._migrate_to_jsonl("interactions")
+        self._offsets = self._index_interactions()
+        self._recent = deque(maxlen=RECENT_INTERACTIONS)
+        # Ids are dense line numbers: the id counter, the log line and the
+        # offset index advance together under _id_lock
+        self._next_id = len(self._offsets)
+        self._id_lock = threading.Lock()
+        
+        # Load existing data (append-only JSONL, one record per line)
+        self.feedback_log = self._load_jsonl("feedback")
+        
+        # Fine-tuning inputs, kept up to date by give_feedback instead of
+        # being rebuilt from the full logs on every preparation; guarded by
+        # _state_lock because preparation reads them on a background thread
+        self._state_lock = threading.Lock()
+        self._good_ratings = {}  # interaction id -> first rating >= GOOD_RATING
+        for f in self.feedback_log:
+            if f['rating'] >= GOOD_RATING:
+                self._good_ratings.setdefault(f['interaction_id'], f['rating'])
+        
+        # Corrections are streamed: only the latest corrected text per
+        # interaction is kept, not the original responses they replace
+        self._correction_map = {}
+        self._correction_count = 0
+        for c in self._iter_jsonl("corrections"):
+            self._correction_map[c['interaction_id']] = c['corrected_response']
+            self._correction_count += 1
+        
+        # One append-only descriptor per log, written through a shared buffer
+        self._log_fds = {
+            name: os.open(
+                os.path.join(self.storage_path, f"{name}.jsonl"),
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC,
+                0o644
+            )
+            for name in ("interactions", "feedback", "corrections")
+        }
+        self._log_size = os.fstat(self._log_fds["interactions"]).st_size
+        self._write_buf = {}
+        self._buffered = 0
+        self._flush_lock = threading.Lock()
+        self._flush_timer = None
+        atexit.register(self.flush)
+        
+        # Fine-tuning preparation runs off the give_feedback caller's thread;
+        # _training_busy is held from scheduling until the job finishes
+        self._training_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oracle-training")
+        self._training_busy = threading.Lock()
+        
+        self._ts_cache = (0, "")  # (time_ns when formatted, ISO string)
         
-        logger.info(f"📚 Loaded {len(self.interaction_log)} interactions")
+        logger.info(f"📚 Indexed {len(self._offsets)} interactions")
         logger.info(f"⭐ Loaded {len(self.feedback_log)} feedback entries")
-        logger.info(f"✏️ Loaded {len(self.corrections_log)} corrections")
+        logger.info(f"✏️ Loaded {self._correction_count} corrections")
         logger.info(f"🤖 Using model: {self.model_name}")
     
     def _load_json(self, filename, default):
@@ -67,40 +152,194 @@ class SelfImprovingOracle:
         filepath = os.path.join(self.storage_path, filename)
         if os.path.exists(filepath):
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(filepath, 'rb') as f:
+                    return orjson.loads(f.read())
             except Exception as e:
                 logger.error(f"Error loading {filename}: {e}")
         return default
     
-    def _save_json(self, filename, data):
-        """Save data to JSON file"""
-        filepath = os.path.join(self.storage_path, filename)
+    def _migrate_to_jsonl(self, name):
+        """Convert a legacy <name>.json array into the <name>.jsonl log once"""
+        jsonl_path = os.path.join(self.storage_path, f"{name}.jsonl")
+        legacy_path = os.path.join(self.storage_path, f"{name}.json")
+        if os.path.exists(jsonl_path) or not os.path.exists(legacy_path):
+            return
+        
+        legacy = self._load_json(f"{name}.json", [])
+        with open(jsonl_path, 'wb') as f:
+            for record in legacy:
+                f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        logger.info(f"📦 Migrated {len(legacy)} records to {name}.jsonl")
+    
+    def _iter_jsonl(self, name):
+        """Yield the records of the <name>.jsonl log one at a time"""
+        self._migrate_to_jsonl(name)
+        filepath = os.path.join(self.storage_path, f"{name}.jsonl")
+        if not os.path.exists(filepath):
+            return
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield orjson.loads(line)
         except Exception as e:
-            logger.error(f"Error saving {filename}: {e}")
+            logger.error(f"Error loading {name}.jsonl: {e}")
+    
+    def _load_jsonl(self, name):
+        """Load every record of the <name>.jsonl log"""
+        return list(self._iter_jsonl(name))
+    
+    def _append_jsonl(self, name, record, durable=False):
+        """
+        Queue one record for the <name>.jsonl log.
+        
+        Args:
+            name: Log name (interactions, feedback or corrections)
+            record: JSON-serializable record
+            durable: Write and fsync before returning instead of batching
+            
+        Returns:
+            The encoded line, newline included
+        """
+        line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        with self._flush_lock:
+            self._write_buf.setdefault(name, []).append(line)
+            self._buffered += 1
+            full = self._buffered >= FLUSH_RECORDS
+            if not (full or durable) and self._flush_timer is None:
+                self._flush_timer = threading.Timer(FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if full or durable:
+            self.flush()
+        return line
+    
+    def flush(self):
+        """Write every buffered record with one write + fsync per log"""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending = 0
+            for name, lines in self._write_buf.items():
+                if not lines:
+                    continue
+                data = b"".join(lines)
+                written = 0
+                try:
+                    fd = self._log_fds[name]
+                    while written < len(data):
+                        written += os.write(fd, data[written:])
+                    os.fsync(fd)
+                except Exception as e:
+                    logger.error(f"Error writing {name}.jsonl: {e}")
+                # Keep whatever did not reach the file for the next flush, so
+                # the offsets handed out by chat() still line up with the log
+                lines.clear()
+                if written < len(data):
+                    lines.append(data[written:])
+                    pending += 1
+            self._buffered = pending
+            if pending and self._flush_timer is None:
+                self._flush_timer = threading.Timer(FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _index_interactions(self):
+        """
+        Build the interaction id -> byte offset index from the JSONL log.
+        
+        Returns:
+            array of line offsets, indexed by interaction id
+        """
+        offsets = array('q')
+        if not os.path.exists(self._interactions_path):
+            return offsets
+        
+        position = 0
+        with open(self._interactions_path, 'rb') as f:
+            for line in f:
+                offsets.append(position)
+                position += len(line)
+        return offsets
+    
+    def _iter_interactions(self, interaction_ids, from_disk=False):
+        """
+        Yield interactions by id, from memory when recent, else from disk.
+        
+        Args:
+            interaction_ids: Iterable of interaction ids (unknown ids are skipped)
+            from_disk: Skip the in-memory ring (for background threads; the
+                caller must flush() first)
+        """
+        f = None
+        try:
+            for interaction_id in interaction_ids:
+                # chat() rotates the ring under _id_lock, so the bounds check and
+                # the ring read (or the offset lookup) happen under it too
+                with self._id_lock:
+                    count = len(self._offsets)
+                    if not 0 <= interaction_id < count:
+                        continue
+                    first_recent = count - (0 if from_disk else len(self._recent))
+                    if interaction_id >= first_recent:
+                        record = self._recent[interaction_id - first_recent]
+                    else:
+                        record = None
+                        offset = self._offsets[interaction_id]
+                if record is not None:
+                    yield record
+                    continue
+                if f is None:
+                    f = open(self._interactions_path, 'rb')
+                f.seek(offset)
+                yield orjson.loads(f.readline())
+        finally:
+            if f is not None:
+                f.close()
+    
+    def _read_interactions(self, interaction_ids):
+        """
+        Fetch interactions by id, from memory when recent, else from disk.
+        
+        Args:
+            interaction_ids: Iterable of interaction ids
+            
+        Returns:
+            List of interaction dicts, in the order requested
+        """
+        return list(self._iter_interactions(interaction_ids))
+    
+    def _now_iso(self):
+        """Current local time as ISO 8601, reformatted at most every 10 ms"""
+        now = time.time_ns()
+        formatted_at, iso = self._ts_cache
+        if now - formatted_at >= TIMESTAMP_RESOLUTION_NS:
+            iso = datetime.now().isoformat()
+            self._ts_cache = (now, iso)
+        return iso
+    
+    def close(self):
+        """Flush pending records and release the logs"""
+        self._training_pool.shutdown(wait=True)
+        self.flush()
+        atexit.unregister(self.flush)
+        for fd in self._log_fds.values():
+            os.close(fd)
+        self._log_fds = {}
     
     def _generate_response(self, user_input, system_prompt=None):
         """Generate response using Grok or OpenAI"""
-        if not system_prompt:
-            system_prompt = """You are a wise oracle embodying 7 spiritual traditions:
-- Christian: compassion, forgiveness, love
-- Buddhist: mindfulness, non-harm, compassion
-- Indigenous: seven generations, connection to earth
-- Humanist: dignity, reason, freedom
-- Islamic: mercy, justice, brotherhood
-- Judaic: learning, justice, community
-- Hindu: dharma, unity, non-attachment
-
-Answer wisely, kindly, and in the same language as the question."""
+        if system_prompt:
+            system_message = {"role": "system", "content": system_prompt}
+        else:
+            system_message = DEFAULT_SYSTEM_MESSAGE
         
         try:
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    system_message,
                     {"role": "user", "content": user_input}
                 ],
                 temperature=0.7,
@@ -134,21 +373,26 @@ Answer wisely, kindly, and in the same language as the question."""
         
         # Create interaction record
         interaction = {
-            'id': len(self.interaction_log),
+            'id': None,
             'input': user_input,
             'response': response,
             'wisdom_confidence': wisdom_check.confidence,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._now_iso()
         }
         
-        self.interaction_log.append(interaction)
-        self._save_json("interactions.json", self.interaction_log)
+        with self._id_lock:
+            interaction['id'] = self._next_id
+            self._next_id += 1
+            line = self._append_jsonl("interactions", interaction)
+            self._offsets.append(self._log_size)
+            self._log_size += len(line)
+            self._recent.append(interaction)
         
         logger.info(f"💬 Interaction #{interaction['id']} logged (wisdom: {wisdom_check.confidence:.1%})")
         
         return response, interaction['id']
     
-    def give_feedback(self, interaction_id, rating, corrected_response=None):
+    def give_feedback(self, interaction_id, rating, corrected_response=None, durable=False):
         """
         User rates response 1-5, optionally provides correction.
         
@@ -156,17 +400,15 @@ Answer wisely, kindly, and in the same language as the question."""
             interaction_id: ID from chat()
             rating: 1-5 (5 = perfect)
             corrected_response: Optional corrected answer
+            durable: Flush to disk before returning instead of batching
         """
         if rating < 1 or rating > 5:
             logger.warning(f"Invalid rating: {rating}")
             return False
         
-        # Find the interaction
-        interaction = None
-        for i in self.interaction_log:
-            if i['id'] == interaction_id:
-                interaction = i
-                break
+        # Interaction ids are assigned sequentially, so the id indexes the log
+        found = self._read_interactions([interaction_id])
+        interaction = found[0] if found else None
         
         if not interaction:
             logger.warning(f"Interaction {interaction_id} not found")
@@ -176,10 +418,13 @@ Answer wisely, kindly, and in the same language as the question."""
         feedback = {
             'interaction_id': interaction_id,
             'rating': rating,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._now_iso()
         }
         self.feedback_log.append(feedback)
-        self._save_json("feedback.json", self.feedback_log)
+        if rating >= GOOD_RATING:
+            with self._state_lock:
+                self._good_ratings.setdefault(interaction_id, rating)
+        self._append_jsonl("feedback", feedback, durable=durable and not corrected_response)
         
         # If correction provided, log it separately
         if corrected_response:
@@ -187,66 +432,90 @@ Answer wisely, kindly, and in the same language as the question."""
                 'interaction_id': interaction_id,
                 'original_response': interaction['response'],
                 'corrected_response': corrected_response,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._now_iso()
             }
-            self.corrections_log.append(correction)
-            self._save_json("corrections.json", self.corrections_log)
+            with self._state_lock:
+                self._correction_map[interaction_id] = corrected_response
+            self._correction_count += 1
+            self._append_jsonl("corrections", correction, durable=durable)
             logger.info(f"✏️ Correction logged for #{interaction_id}")
         
         logger.info(f"⭐ Feedback #{len(self.feedback_log)}: {rating}/5 for #{interaction_id}")
         
         # Check if we should fine-tune
         if len(self.feedback_log) >= 10 and len(self.feedback_log) % 10 == 0:
-            self._prepare_fine_tuning()
+            self._schedule_fine_tuning()
         
         return True
     
+    def _schedule_fine_tuning(self):
+        """Queue fine-tuning preparation unless a run is already pending"""
+        if not self._training_busy.acquire(blocking=False):
+            logger.info("🎓 Fine-tuning preparation already running; skipping this trigger")
+            return
+        self._training_pool.submit(self._run_fine_tuning)
+    
+    def _run_fine_tuning(self):
+        """Background job: prepare fine-tuning data, then allow the next run"""
+        try:
+            self._prepare_fine_tuning()
+        except Exception as e:
+            logger.error(f"Fine-tuning preparation failed: {e}")
+        finally:
+            self._training_busy.release()
+    
     def _prepare_fine_tuning(self):
         """Prepare high-quality data for fine-tuning"""
         
-        # Get all interactions with rating >= 4
-        good_feedback = [f for f in self.feedback_log if f['rating'] >= 4]
-        good_ids = {f['interaction_id'] for f in good_feedback}
-        
-        # Get corrections
-        correction_map = {c['interaction_id']: c['corrected_response'] 
-                         for c in self.corrections_log}
+        # Snapshot the inputs, then make every interaction readable from disk
+        with self._state_lock:
+            good_ids = sorted(self._good_ratings)
+            correction_map = dict(self._correction_map)
+        self.flush()
         
-        # Build training data
-        training_data = []
-        for interaction in self.interaction_log:
-            if interaction['id'] in good_ids:
+        # Stream examples from interactions rated >= GOOD_RATING straight to
+        # JSONL (the fine-tuning upload format); a temp file keeps the last
+        # good export in place until this one is complete
+        training_path = os.path.join(self.storage_path, "training_data.jsonl")
+        partial_path = training_path + ".tmp"
+        example_count = 0
+        with open(partial_path, 'wb') as f:
+            for interaction in self._iter_interactions(good_ids, from_disk=True):
                 # Use corrected response if available, otherwise original
                 response = correction_map.get(interaction['id'], interaction['response'])
                 
-                training_data.append({
+                f.write(orjson.dumps({
                     "messages": [
                         {"role": "system", "content": "You are a wise oracle embodying 7 traditions."},
                         {"role": "user", "content": interaction['input']},
                         {"role": "assistant", "content": response}
                     ]
-                })
+                }, option=orjson.OPT_APPEND_NEWLINE))
+                example_count += 1
         
-        if len(training_data) >= 5:
-            self._save_json("training_data.json", training_data)
-            logger.info(f"🎓 Prepared {len(training_data)} examples for fine-tuning")
-            
-            # Here you would call the actual fine-tuning API
-            # For Grok: Not yet available
-            # For OpenAI: fine_tuning.jobs.create()
-            self._fine_tune(training_data)
+        if example_count < 5:
+            os.remove(partial_path)
+            return
+        
+        os.replace(partial_path, training_path)
+        logger.info(f"🎓 Prepared {example_count} examples for fine-tuning")
+        
+        # Here you would call the actual fine-tuning API
+        # For Grok: Not yet available
+        # For OpenAI: fine_tuning.jobs.create()
+        self._fine_tune(training_path, example_count)
     
-    def _fine_tune(self, training_data):
+    def _fine_tune(self, training_path, example_count):
         """Actual fine-tuning (when available)"""
         logger.info("🔄 Ready to fine-tune on high-quality responses")
-        logger.info(f"   Training examples: {len(training_data)}")
+        logger.info(f"   Training examples: {example_count}")
         
         if self.use_grok:
             logger.info("   Note: Grok fine-tuning not yet available")
         else:
             logger.info("   Would call OpenAI fine-tuning API here")
             # Example:
-            # file = self.client.files.create(file=json_data)
+            # file = self.client.files.create(file=open(training_path, "rb"), purpose="fine-tune")
             # job = self.client.fine_tuning.jobs.create(
             #     training_file=file.id,
             #     model="gpt-4o-mini"
@@ -259,31 +528,30 @@ Answer wisely, kindly, and in the same language as the question."""
             avg_rating = sum(f['rating'] for f in self.feedback_log) / len(self.feedback_log)
         
         return {
-            'total_interactions': len(self.interaction_log),
+            'total_interactions': self._next_id,
             'total_feedback': len(self.feedback_log),
-            'total_corrections': len(self.corrections_log),
+            'total_corrections': self._correction_count,
             'average_rating': round(avg_rating, 2),
             'model': self.model_name
         }
     
-    def export_for_training(self, min_rating=4):
+    def export_for_training(self, min_rating=GOOD_RATING):
         """Export high-quality conversations for training"""
-        good_feedback = [f for f in self.feedback_log if f['rating'] >= min_rating]
-        good_ids = {f['interaction_id'] for f in good_feedback}
-        
-        correction_map = {c['interaction_id']: c['corrected_response'] 
-                         for c in self.corrections_log}
+        if min_rating == GOOD_RATING:
+            rating_by_id = self._good_ratings
+        else:
+            good_feedback = [f for f in self.feedback_log if f['rating'] >= min_rating]
+            # First qualifying rating per interaction (reversed, so earliest wins)
+            rating_by_id = {f['interaction_id']: f['rating'] for f in reversed(good_feedback)}
         
         export = []
-        for interaction in self.interaction_log:
-            if interaction['id'] in good_ids:
-                response = correction_map.get(interaction['id'], interaction['response'])
-                export.append({
-                    'input': interaction['input'],
-                    'response': response,
-                    'rating': next(f['rating'] for f in good_feedback 
-                                  if f['interaction_id'] == interaction['id'])
-                })
+        for interaction in self._read_interactions(sorted(rating_by_id)):
+            response = self._correction_map.get(interaction['id'], interaction['response'])
+            export.append({
+                'input': interaction['input'],
+                'response': response,
+                'rating': rating_by_id[interaction['id']]
+            })
         
         return export
 
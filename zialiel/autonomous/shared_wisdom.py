@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# shared_wisdom.py - One WisdomOracle per process
+
+"""
+WisdomOracle holds only read-only quote and tradition tables after
+construction, so every oracle in a process can share a single instance.
+"""
+
+import functools
+from wisdom_oracle import WisdomOracle
+
+
+@functools.lru_cache(maxsize=1)
+def get_wisdom_oracle():
+    """Return the process-wide WisdomOracle, building it on first use"""
+    return WisdomOracle()
@@ -1,7 +1,9 @@
 
 import logging
-from typing import List, Dict, Any
-from collections import defaultdict
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set, Deque
 
 from .vertex import SuperVertex
 from .dag import DAG
@@ -9,6 +11,14 @@ from .real_mldsa_service import RealMLDSAService
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Threads used to verify a quorum's vote signatures in parallel
+VERIFY_WORKERS = min(8, os.cpu_count() or 1)
+
+# One verification pool for the whole process: every engine and node submits
+# here, so N nodes share VERIFY_WORKERS threads instead of each owning a pool.
+# Workers are only started on first use.
+VERIFY_POOL = ThreadPoolExecutor(max_workers=VERIFY_WORKERS, thread_name_prefix="zialiel-verify")
+
 class CommitteeManager:
     """
     Manages the validator committee, including selection, rotation, and history.
@@ -16,15 +26,32 @@ class CommitteeManager:
     def __init__(self, initial_committee: List[str]):
         self.current_committee: List[str] = initial_committee
         self.committee_history: List[List[str]] = [initial_committee]
+        self._set_committee(initial_committee)
         logging.info(f"CommitteeManager initialized with committee: {self.current_committee}")
 
+    def _set_committee(self, committee: List[str]):
+        """Precomputes membership and the finality threshold for a committee."""
+        self._committee_set = frozenset(committee)
+        # BFT requires > 2/3 of votes. For simplicity, we'll use ceil(2/3 * N).
+        self._required_votes = int(len(committee) * 2 / 3) + 1
+
     def get_current_committee(self) -> List[str]:
         return self.current_committee
 
+    def is_member(self, node_id: str) -> bool:
+        """Returns True if node_id sits on the current committee."""
+        return node_id in self._committee_set
+
+    @property
+    def required_votes(self) -> int:
+        """Number of votes needed to finalize under the current committee."""
+        return self._required_votes
+
     def rotate_committee(self, new_committee: List[str]):
         """Updates the committee and records the change in history."""
         self.current_committee = new_committee
         self.committee_history.append(new_committee)
+        self._set_committee(new_committee)
         logging.info(f"Committee rotated. New committee: {self.current_committee}")
 
 class QDBFT:
@@ -34,19 +61,26 @@ class QDBFT:
     This engine is responsible for finalizing SuperVertices through a multi-round
     voting process among a designated committee.
     """
-    def __init__(self, node_id: str, committee_manager: CommitteeManager, mldsa_service: RealMLDSAService):
+    def __init__(self, node_id: str, committee_manager: CommitteeManager, mldsa_service: RealMLDSAService,
+                 public_keys: Optional[Dict[str, bytes]] = None):
         self.node_id = node_id
         self.committee_manager = committee_manager
         self.mldsa_service = mldsa_service
-        self.pending_votes: Dict[str, Dict[str, bytes]] = defaultdict(dict)  # super_vertex_hash -> {voter_id: signature}
+        # voter_id -> public key; when given, vote signatures are verified at finality
+        self.public_keys = public_keys
+        self._verify_pool = VERIFY_POOL
+        # super_vertex_hash -> {voter_id: signature}; a plain dict so reads never insert
+        self.pending_votes: Dict[str, Dict[str, bytes]] = {}
         self.finalized_super_vertices: Set[str] = set()
+        # Finalized hashes not yet handed out by pop_newly_finalized(), oldest first
+        self._newly_finalized: Deque[str] = deque()
 
     def propose_super_vertex(self, super_vertex: SuperVertex, private_key: bytes):
         """
         A committee member proposes a new SuperVertex to be finalized.
         The proposal is essentially the first vote.
         """
-        if self.node_id not in self.committee_manager.get_current_committee():
+        if not self.committee_manager.is_member(self.node_id):
             logging.warning(f"Node {self.node_id} is not in the current committee. Cannot propose.")
             return
 
@@ -58,7 +92,7 @@ class QDBFT:
         A committee member casts a vote for a super-vertex.
         The vote is a signature on the super-vertex hash.
         """
-        if self.node_id not in self.committee_manager.get_current_committee():
+        if not self.committee_manager.is_member(self.node_id):
             logging.warning(f"Node {self.node_id} is not in the current committee. Cannot vote.")
             return
 
@@ -67,7 +101,7 @@ class QDBFT:
             return
 
         signature = self.mldsa_service.sign(private_key, super_vertex_hash.encode())
-        self.pending_votes[super_vertex_hash][self.node_id] = signature
+        self.pending_votes.setdefault(super_vertex_hash, {})[self.node_id] = signature
         logging.info(f"Node {self.node_id} cast a vote for super-vertex {super_vertex_hash}.")
 
         self._check_for_finality(super_vertex_hash)
@@ -76,17 +110,52 @@ class QDBFT:
         """
         Checks if a super-vertex has enough votes to be finalized.
         """
-        committee = self.committee_manager.get_current_committee()
-        votes = self.pending_votes.get(super_vertex_hash, {})
-        
-        # BFT requires > 2/3 of votes. For simplicity, we'll use ceil(2/3 * N).
-        required_votes = int(len(committee) * 2 / 3) + 1
+        votes = self.pending_votes.get(super_vertex_hash)
+        if votes is None:
+            return
 
+        required_votes = self.committee_manager.required_votes
         if len(votes) >= required_votes:
-            # In a real system, we would need to verify all signatures here.
-            # We assume they are valid for this simulation.
+            # Signatures are checked once, for the whole quorum, only when it is
+            # reached. Without known public keys they are assumed valid.
+            if self.public_keys is not None:
+                self._drop_invalid_votes(super_vertex_hash, votes)
+                if len(votes) < required_votes:
+                    return
+
             self.finalized_super_vertices.add(super_vertex_hash)
+            self._newly_finalized.append(super_vertex_hash)
             logging.info(f"FINALIZED: Super-vertex {super_vertex_hash} has been finalized with {len(votes)} votes.")
             
             # Clean up votes for the finalized block
-            del self.pending_votes[super_vertex_hash]
+            self.pending_votes.pop(super_vertex_hash, None)
+
+    def pop_newly_finalized(self) -> List[str]:
+        """
+        Returns the super-vertex hashes finalized since the last call, in the
+        order they were finalized, so callers never rescan the finalized set.
+        """
+        finalized = list(self._newly_finalized)
+        self._newly_finalized.clear()
+        return finalized
+
+    def _drop_invalid_votes(self, super_vertex_hash: str, votes: Dict[str, bytes]):
+        """
+        Verifies all votes for a super-vertex in parallel and removes the invalid ones.
+
+        liboqs releases the GIL while verifying, so the signatures of a quorum are
+        checked concurrently instead of one after another on the voting thread.
+        """
+        # Encoded once here and shared by every vote's check
+        message = super_vertex_hash.encode()
+
+        def verify(item):
+            voter_id, signature = item
+            public_key = self.public_keys.get(voter_id)
+            return public_key is not None and self.mldsa_service.verify(public_key, message, signature)
+
+        items = list(votes.items())
+        for (voter_id, _), valid in zip(items, self._verify_pool.map(verify, items)):
+            if not valid:
+                logging.warning(f"Dropping invalid vote from {voter_id} for super-vertex {super_vertex_hash}.")
+                del votes[voter_id]
@@ -14,6 +14,8 @@ class DAG:
         self.vertices: Dict[str, Vertex] = {}
         self.super_vertices: Dict[str, SuperVertex] = {}
         self.tips: Set[str] = set()  # Hashes of vertices that are tips of the DAG
+        self._confirmed_hashes: Set[str] = set()  # Vertices included in some super-vertex
+        self._unconfirmed: Dict[str, Vertex] = {}  # Vertices not yet in any super-vertex, in insertion order
 
     def add_vertex(self, vertex: Vertex) -> bool:
         """
@@ -36,6 +38,8 @@ class DAG:
                 return False
 
         self.vertices[vertex.hash] = vertex
+        if vertex.hash not in self._confirmed_hashes:
+            self._unconfirmed[vertex.hash] = vertex
         self._update_tips(vertex)
         logging.info(f"Added vertex {vertex.hash} to the DAG.")
         return True
@@ -50,6 +54,9 @@ class DAG:
         
         # In a real scenario, we would validate the cohort and merkle roots here
         self.super_vertices[super_vertex.hash] = super_vertex
+        self._confirmed_hashes.update(super_vertex.cohort_hashes)
+        for vertex_hash in super_vertex.cohort_hashes:
+            self._unconfirmed.pop(vertex_hash, None)
         logging.info(f"Added super-vertex {super_vertex.hash} to the DAG.")
         return True
 
@@ -59,9 +66,7 @@ class DAG:
         A tip is a vertex that is not a parent to any other vertex.
         """
         # Remove parents of the new vertex from the tips set
-        for parent_hash in new_vertex.parent_hashes:
-            if parent_hash in self.tips:
-                self.tips.remove(parent_hash)
+        self.tips.difference_update(new_vertex.parent_hashes)
         
         # Add the new vertex as a tip
         self.tips.add(new_vertex.hash)
@@ -79,10 +84,6 @@ class DAG:
         Placeholder for getting vertices not yet included in a super-vertex.
         In a real implementation, this would involve tracking vertex confirmation status.
         """
-        # This is a simplified logic. A real system needs a robust way to track this.
-        confirmed_hashes = set()
-        for sv in self.super_vertices.values():
-            confirmed_hashes.update(sv.cohort_hashes)
-        
-        return [v for h, v in self.vertices.items() if h not in confirmed_hashes]
+        # Maintained by add_vertex / add_super_vertex, so no scan of the DAG
+        return list(self._unconfirmed.values())
 
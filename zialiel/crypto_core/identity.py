@@ -2,10 +2,12 @@
 # 2. IDENTITY + REPUTATION
 # -------------------------------------
 
+from array import array
 from dataclasses import dataclass
-from typing import List
+from operator import itemgetter, mul
+from typing import Dict, List
 
-@dataclass
+@dataclass(slots=True)
 class DID:
     """Decentralized Identifier"""
     id: str
@@ -13,7 +15,7 @@ class DID:
     created_at: int
     credentials: List[dict]  # Verifiable credentials from attestors
     
-@dataclass
+@dataclass(slots=True)
 class Reputation:
     did: str
     score: float  # 0-100
@@ -26,6 +28,18 @@ class Reputation:
         # - gratitude_received: float
     last_updated: int
     
+    # Factor weights, in the order the weighted sum adds them up
+    FACTOR_NAMES = (
+        'transaction_history',
+        'dispute_resolutions',
+        'attestations_received',
+        'governance_participation',
+        'public_goods_contributions',
+        'gratitude_received',
+    )
+    WEIGHTS = (0.2, 0.15, 0.25, 0.1, 0.2, 0.1)
+    _factor_values = staticmethod(itemgetter(*FACTOR_NAMES))
+    
     def decay(self):
         """Reputation gradually decays without activity"""
         self.score *= 0.99  # 1% decay per period
@@ -36,12 +50,76 @@ class Reputation:
             self.recalculate()
     
     def recalculate(self):
-        weighted = (
-            self.factors['transaction_history'] * 0.2 +
-            self.factors['dispute_resolutions'] * 0.15 +
-            self.factors['attestations_received'] * 0.25 +
-            self.factors['governance_participation'] * 0.1 +
-            self.factors['public_goods_contributions'] * 0.2 +
-            self.factors['gratitude_received'] * 0.1
-        )
+        # One C-level fetch of all factors, then a dot product with WEIGHTS
+        weighted = sum(map(mul, self._factor_values(self.factors), self.WEIGHTS))
         self.score = min(100, weighted)
+
+
+# 1% decay per period, as in Reputation.decay
+_DECAY = 0.99
+
+
+def _weighted_score(*factor_values: float) -> float:
+    """Reputation score from factor values given in FACTOR_NAMES order"""
+    return min(100, sum(map(mul, factor_values, Reputation.WEIGHTS)))
+
+
+class ReputationTable:
+    """
+    Column-oriented store for many reputations.
+    
+    Scores, each factor and last_updated are kept as packed arrays indexed
+    by row, so epoch-wide decay and recalculation are single passes over
+    the columns instead of one method call per Reputation.
+    """
+    
+    def __init__(self):
+        self.dids: List[str] = []
+        self.index: Dict[str, int] = {}  # did -> row
+        self.scores = array('d')
+        self.factors = {name: array('d') for name in Reputation.FACTOR_NAMES}
+        self.last_updated = array('q')
+    
+    def __len__(self):
+        return len(self.dids)
+    
+    def add(self, did: str, factors: dict, last_updated: int) -> int:
+        """Adds a reputation and returns its row"""
+        row = len(self.dids)
+        self.dids.append(did)
+        self.index[did] = row
+        for name, column in self.factors.items():
+            column.append(factors.get(name, 0.0))
+        self.scores.append(self._score(row))
+        self.last_updated.append(last_updated)
+        return row
+    
+    def get(self, did: str) -> Reputation:
+        """Materializes one row as a Reputation"""
+        row = self.index[did]
+        return Reputation(
+            did=did,
+            score=self.scores[row],
+            factors={name: column[row] for name, column in self.factors.items()},
+            last_updated=self.last_updated[row]
+        )
+    
+    def boost(self, did: str, factor: str, amount: float):
+        column = self.factors.get(factor)
+        if column is not None:
+            row = self.index[did]
+            column[row] += amount
+            self.scores[row] = self._score(row)
+    
+    def decay_all(self):
+        """Applies one period of decay to every score"""
+        self.scores = array('d', map(_DECAY.__mul__, self.scores))
+    
+    def recalculate_all(self):
+        """Recomputes every score from its factors"""
+        columns = [self.factors[name] for name in Reputation.FACTOR_NAMES]
+        self.scores = array('d', map(_weighted_score, *columns))
+    
+    def _score(self, row: int) -> float:
+        return _weighted_score(*(self.factors[name][row] for name in Reputation.FACTOR_NAMES))
+
@@ -1,5 +1,7 @@
 
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict
 import oqs
 
@@ -7,6 +9,25 @@ from .interfaces import MLDSAService
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Secret keys whose liboqs signer stays cached; a node signs with a single key,
+# so this only needs to cover the nodes sharing one service
+SIGNER_CACHE_SIZE = 16
+
+class _CachedSigner:
+    """A cached liboqs signer and the lock that keeps it from being freed mid-sign."""
+    __slots__ = ("signer", "lock", "freed")
+
+    def __init__(self, signer: oqs.Signature):
+        self.signer = signer
+        self.lock = threading.Lock()
+        self.freed = False
+
+    def free(self):
+        with self.lock:
+            if not self.freed:
+                self.signer.free()
+                self.freed = True
+
 class RealMLDSAService(MLDSAService):
     """
     A real implementation of the ML-DSA service using the liboqs-python library.
@@ -17,8 +38,40 @@ class RealMLDSAService(MLDSAService):
         if not oqs.is_sig_enabled(algorithm):
             raise oqs.MechanismNotSupportedError(f"Signature algorithm {algorithm} is not supported by this build of liboqs.")
         self.algorithm = algorithm
+        # Signature objects are reused: one signer per recently used secret key
+        # (least recently used first, freed on eviction), and one verifier for
+        # all public keys (the key is passed per call, so it needs no per-key state)
+        self._signers: OrderedDict = OrderedDict()
+        self._signers_lock = threading.Lock()
+        self._verifier = oqs.Signature(self.algorithm)
         logging.info(f"RealMLDSAService initialized with {self.algorithm}.")
 
+    def _get_signer(self, private_key: bytes) -> _CachedSigner:
+        """Returns the cached signer for a secret key, creating it and evicting the oldest if needed."""
+        evicted = None
+        with self._signers_lock:
+            entry = self._signers.get(private_key)
+            if entry is not None:
+                self._signers.move_to_end(private_key)
+                return entry
+            entry = _CachedSigner(oqs.Signature(self.algorithm, private_key))
+            self._signers[private_key] = entry
+            if len(self._signers) > SIGNER_CACHE_SIZE:
+                _, evicted = self._signers.popitem(last=False)
+        if evicted is not None:
+            # Waits for any sign() still using it
+            evicted.free()
+        return entry
+
+    def close(self):
+        """Frees the cached liboqs signature objects."""
+        with self._signers_lock:
+            entries = list(self._signers.values())
+            self._signers.clear()
+        for entry in entries:
+            entry.free()
+        self._verifier.free()
+
     def generate_keypair(self) -> Dict[str, bytes]:
         """
         Generates a new Dilithium3 keypair.
@@ -43,9 +96,12 @@ class RealMLDSAService(MLDSAService):
         Returns:
             bytes: The resulting signature.
         """
-        with oqs.Signature(self.algorithm, private_key) as signer:
-            signature = signer.sign(message)
-            return signature
+        while True:
+            entry = self._get_signer(private_key)
+            with entry.lock:
+                # An entry evicted between lookup and lock is simply fetched again
+                if not entry.freed:
+                    return entry.signer.sign(message)
 
     def verify(self, public_key: bytes, message: bytes, signature: bytes) -> bool:
         """
@@ -60,8 +116,7 @@ class RealMLDSAService(MLDSAService):
             bool: True if the signature is valid, False otherwise.
         """
         try:
-            with oqs.Signature(self.algorithm) as verifier:
-                return verifier.verify(message, signature, public_key)
+            return self._verifier.verify(message, signature, public_key)
         except Exception as e:
             logging.error(f"An error occurred during signature verification: {e}")
             return False
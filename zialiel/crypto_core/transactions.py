@@ -1,37 +1,99 @@
 
 import hashlib
+import itertools
+import secrets
+import struct
 import time
-import json
 from dataclasses import dataclass, field, asdict
+from typing import Optional
 
-@dataclass
+# Fixed-width tail of the signable message: amount, fee, timestamp
+_pack_numbers = struct.Struct('<qqd').pack
+# Length prefix written before each string field of the signable message
+_pack_length = struct.Struct('<I').pack
+
+# Transaction ids are a random per-process prefix plus a counter: unique
+# within the process without a clock read or a hash per transaction
+_ID_PREFIX = secrets.token_hex(4)
+_id_counter = itertools.count(1)
+
+def _next_id() -> str:
+    return f"{_ID_PREFIX}{next(_id_counter):012x}"
+
+# Fields covered by to_message(); changing one drops the cached message and hash
+_SIGNED_FIELDS = frozenset({'sender', 'recipient', 'amount', 'fee', 'id', 'timestamp'})
+
+@dataclass(slots=True)
 class Transaction:
     """
     Represents a single transaction in the Zialiel network.
     """
-    id: str = field(default_factory=lambda: hashlib.sha256(str(time.time()).encode()).hexdigest())
     sender: str
     recipient: str
     amount: int
     fee: int
+    id: str = field(default_factory=_next_id)
     timestamp: float = field(default_factory=time.time)
     signature: bytes = b''
+    # to_message() bytes and their digest, filled in on first use
+    _message: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _hash: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name in _SIGNED_FIELDS:
+            object.__setattr__(self, '_message', None)
+            object.__setattr__(self, '_hash', None)
+        object.__setattr__(self, name, value)
+
+    @staticmethod
+    def _whole_units(name: str, value) -> int:
+        """Amount or fee as an int; integral floats are accepted, anything else is rejected."""
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        raise ValueError(f"Transaction {name} must be a whole number of units, got {value!r}")
 
     def to_message(self) -> bytes:
         """
         Creates a canonical, signable representation of the transaction.
         The signature itself is excluded from the message.
+        The bytes are built once; signing, verification and hashing all reuse them.
         """
-        d = asdict(self)
-        # Exclude the signature for the message to be signed
-        d.pop('signature', None)
-        # Sort keys for a consistent order
-        return json.dumps(d, sort_keys=True).encode()
+        if self._message is None:
+            # Fixed field order: each string prefixed with its byte length, then the
+            # fixed-width numbers, so no two transactions share a message
+            parts = []
+            for text in (self.sender, self.recipient, self.id):
+                encoded = text.encode()
+                parts.append(_pack_length(len(encoded)))
+                parts.append(encoded)
+            amount = self._whole_units('amount', self.amount)
+            fee = self._whole_units('fee', self.fee)
+            try:
+                parts.append(_pack_numbers(amount, fee, self.timestamp))
+            except struct.error as e:
+                raise ValueError(f"Transaction amount or fee out of range: {e}") from e
+            self._message = b''.join(parts)
+        return self._message
 
     def to_dict(self) -> dict:
         """Returns a dictionary representation of the transaction."""
-        return asdict(self)
+        d = asdict(self)
+        d.pop('_message', None)
+        d.pop('_hash', None)
+        return d
+
+    def content_hash(self) -> bytes:
+        """
+        SHA256 digest of the signable message, computed once and cached.
+        Vertices hash and serialize their transactions repeatedly, so the
+        message is only built and hashed the first time.
+        """
+        if self._hash is None:
+            self._hash = hashlib.sha256(self.to_message()).digest()
+        return self._hash
 
     def calculate_hash(self) -> str:
         """Calculates the hash of the transaction's signable message."""
-        return hashlib.sha256(self.to_message()).hexdigest()
+        return self.content_hash().hex()
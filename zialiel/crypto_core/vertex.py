@@ -1,12 +1,16 @@
 
 import hashlib
+import struct
 import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 from .transactions import Transaction
 
-@dataclass
+# Precompiled packer for the timestamp field of hash pre-images
+_pack_timestamp = struct.Struct('<d').pack
+
+@dataclass(slots=True)
 class Vertex:
     """
     Represents a single vertex in the DAG, containing a batch of transactions.
@@ -23,8 +27,19 @@ class Vertex:
 
     def calculate_hash(self) -> str:
         """Calculates the SHA256 hash of the vertex's content."""
-        block_string = f"{{'transactions': [tx.calculate_hash() for tx in self.transactions], 'parents': self.parent_hashes, 'creator': self.creator_id, 'timestamp': self.timestamp}}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        # The old pre-image was a constant string (the braces were escaped, so
+        # nothing was interpolated) and every vertex hashed the same. Build it
+        # from the actual content: the text fields, then the packed timestamp,
+        # then the fixed-size 32-byte transaction digests.
+        # The digests are fed with update() so the (possibly large) digest block
+        # is not copied again into one combined buffer.
+        h = hashlib.sha256(b'|'.join((
+            ','.join(self.parent_hashes).encode(),
+            self.creator_id.encode(),
+            _pack_timestamp(self.timestamp),
+        )))
+        h.update(b''.join([tx.content_hash() for tx in self.transactions]))
+        return h.hexdigest()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -35,7 +50,7 @@ class Vertex:
             "timestamp": self.timestamp,
         }
 
-@dataclass
+@dataclass(slots=True)
 class SuperVertex:
     """
     A special vertex that acts as a checkpoint for a set of vertices (a cohort).
@@ -54,8 +69,11 @@ class SuperVertex:
     signature: bytes = b''
 
     def __post_init__(self):
-        self.transaction_merkle_root = self._calculate_merkle_root([h for h in self.cohort_hashes]) # Simplified: using cohort hashes as stand-ins for tx hashes
-        self.structure_merkle_root = self._calculate_merkle_root([h for h in self.cohort_hashes])
+        # Simplified: cohort hashes stand in for both tx hashes and structure,
+        # so the two roots are identical; compute the tree once and share it
+        root = self._calculate_merkle_root(self.cohort_hashes)
+        self.transaction_merkle_root = root
+        self.structure_merkle_root = root
         self.hash = self.calculate_hash()
 
     def _calculate_merkle_root(self, items: List[str]) -> str:
@@ -63,21 +81,35 @@ class SuperVertex:
         if not items:
             return hashlib.sha256(b'').hexdigest()
 
-        hashed_items = [hashlib.sha256(item.encode()).hexdigest() for item in items]
+        # hashlib is backed by OpenSSL, which already dispatches to the SHA
+        # extensions (SHA-NI / ARMv8 SHA2) when the CPU has them; what is left
+        # to trim is the interpreter overhead around each call.
+        sha256 = hashlib.sha256
+        # Work on raw 32-byte digests so each pair is exactly one 64-byte
+        # SHA256 block; only the final root is hex-encoded.
+        hashed_items = [sha256(item.encode()).digest() for item in items]
 
         while len(hashed_items) > 1:
             if len(hashed_items) % 2 != 0:
                 hashed_items.append(hashed_items[-1])  # Duplicate the last item if odd
-            
-            next_level = []
-            for i in range(0, len(hashed_items), 2):
-                combined = hashed_items[i] + hashed_items[i+1]
-                next_level.append(hashlib.sha256(combined.encode()).hexdigest())
-            hashed_items = next_level
+
+            # Hash every sibling pair of the level in one comprehension
+            hashed_items = [
+                sha256(left + right).digest()
+                for left, right in zip(hashed_items[0::2], hashed_items[1::2])
+            ]
         
-        return hashed_items[0]
+        return hashed_items[0].hex()
 
     def calculate_hash(self) -> str:
         """Calculates the hash of the SuperVertex."""
-        block_string = f"{{'parent': self.parent_super_vertex_hash, 'creator': self.creator_id, 'timestamp': self.timestamp, 'tx_root': self.transaction_merkle_root, 'struct_root': self.structure_merkle_root}}"
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        # Same fix as Vertex.calculate_hash: hash the real fields, with the
+        # Merkle roots as their raw 32-byte digests.
+        payload = b'|'.join((
+            bytes.fromhex(self.transaction_merkle_root),
+            bytes.fromhex(self.structure_merkle_root),
+            self.parent_super_vertex_hash.encode(),
+            self.creator_id.encode(),
+            _pack_timestamp(self.timestamp),
+        ))
+        return hashlib.sha256(payload).hexdigest()
@@ -1,14 +1,57 @@
 
 import logging
 import math
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 # --- Constants ---
 BASE_FEE = 10
 CONGESTION_MULTIPLIER_MAX = 5.0
 CONGESTION_THRESHOLD_VERTICES = 100
-
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Fee multiplier per transaction priority; unknown priorities are treated as "low"
+PRIORITY_MULTIPLIERS = {"low": 1.0, "normal": 1.5, "high": 2.0}
+# Fee split in basis points: validator, UBI, carbon offsets, gratitude
+_SPLITS_BP = (6000, 2000, 1000, 1000)
+
+logger = logging.getLogger(__name__)
+
+def _congestion_multiplier(mempool_size: int) -> float:
+    """Multiplier scaling linearly from 1.0 at the threshold to CONGESTION_MULTIPLIER_MAX."""
+    congestion_range = (CONGESTION_THRESHOLD_VERTICES * 10) - CONGESTION_THRESHOLD_VERTICES
+    current_congestion = mempool_size - CONGESTION_THRESHOLD_VERTICES
+
+    # Calculate how far into the congestion zone we are (0.0 to 1.0)
+    congestion_factor = min(1.0, current_congestion / congestion_range)
+
+    # Scale multiplier linearly from 1.0 to CONGESTION_MULTIPLIER_MAX, capped
+    return min(1.0 + congestion_factor * (CONGESTION_MULTIPLIER_MAX - 1.0), CONGESTION_MULTIPLIER_MAX)
+
+@lru_cache(maxsize=4096)
+def _fee_for(priority_multiplier: float, mempool_size: int) -> int:
+    """Pure fee arithmetic, memoized; call through _fee() so the key is clamped."""
+    fee = BASE_FEE * priority_multiplier
+    if mempool_size > CONGESTION_THRESHOLD_VERTICES:
+        fee *= _congestion_multiplier(mempool_size)
+    return max(1, math.ceil(fee))
+
+def _fee(priority_multiplier: float, mempool_size: int) -> int:
+    """Fee shared by the single and batch entry points."""
+    # Fees are flat up to the threshold and capped from 10x the threshold on,
+    # so clamping the size bounds the cache without changing any result
+    mempool_size = min(max(mempool_size, CONGESTION_THRESHOLD_VERTICES), CONGESTION_THRESHOLD_VERTICES * 10)
+    return _fee_for(priority_multiplier, mempool_size)
+
+@lru_cache(maxsize=1024)
+def _split_fee(total_fee: int) -> Tuple[int, int, int, int]:
+    """Validator, UBI, carbon and gratitude shares of a fee, in _SPLITS_BP order."""
+    _, ubi_bp, carbon_bp, gratitude_bp = _SPLITS_BP
+    ubi_share = total_fee * ubi_bp // 10_000
+    carbon_share = total_fee * carbon_bp // 10_000
+    gratitude_share = total_fee * gratitude_bp // 10_000
+
+    # Integer math throughout; the validator takes whatever is left, so the
+    # shares always sum to exactly total_fee
+    return total_fee - ubi_share - carbon_share - gratitude_share, ubi_share, carbon_share, gratitude_share
 
 class FeeModel:
     """
@@ -27,43 +70,49 @@ class FeeModel:
         Returns:
             int: The calculated transaction fee, as an integer.
         """
-        fee = float(BASE_FEE)
+        if priority not in PRIORITY_MULTIPLIERS:
+            logger.warning("Unknown priority '%s'. Defaulting to low priority.", priority)
+            priority = "low"
+
+        # Formatting the log lines costs more than the arithmetic; with INFO off
+        # the fee comes straight from the memoized calculation
+        if not logger.isEnabledFor(logging.INFO):
+            return _fee(PRIORITY_MULTIPLIERS[priority], mempool_size)
 
         # 1. Apply priority multiplier
-        if priority == "high":
-            fee *= 2.0
-        elif priority == "normal":
-            fee *= 1.5
-        elif priority == "low":
-            fee *= 1.0
-        else:
-            logging.warning(f"Unknown priority '{priority}'. Defaulting to low priority.")
-            priority = "low"
-            fee *= 1.0
-        
-        logging.info(f"Fee after priority '{priority}' multiplier: {fee}")
+        fee = BASE_FEE * PRIORITY_MULTIPLIERS[priority]
+        logger.info("Fee after priority '%s' multiplier: %s", priority, fee)
 
         # 2. Apply congestion pricing
         if mempool_size > CONGESTION_THRESHOLD_VERTICES:
-            congestion_range = (CONGESTION_THRESHOLD_VERTICES * 10) - CONGESTION_THRESHOLD_VERTICES
-            current_congestion = mempool_size - CONGESTION_THRESHOLD_VERTICES
-            
-            # Calculate how far into the congestion zone we are (0.0 to 1.0)
-            congestion_factor = min(1.0, current_congestion / congestion_range)
-            
-            # Scale multiplier linearly from 1.0 to CONGESTION_MULTIPLIER_MAX
-            congestion_multiplier = 1.0 + congestion_factor * (CONGESTION_MULTIPLIER_MAX - 1.0)
-            
-            # Cap the multiplier
-            congestion_multiplier = min(congestion_multiplier, CONGESTION_MULTIPLIER_MAX)
-            
+            congestion_multiplier = _congestion_multiplier(mempool_size)
             fee *= congestion_multiplier
-            logging.info(f"Mempool size {mempool_size} exceeds threshold {CONGESTION_THRESHOLD_VERTICES}. Applying congestion multiplier {congestion_multiplier:.2f}. New fee: {fee}")
+            logger.info("Mempool size %d exceeds threshold %d. Applying congestion multiplier %.2f. New fee: %s",
+                        mempool_size, CONGESTION_THRESHOLD_VERTICES, congestion_multiplier, fee)
 
         final_fee = max(1, math.ceil(fee))
-        logging.info(f"Final calculated fee: {final_fee}")
+        logger.info("Final calculated fee: %d", final_fee)
         return final_fee
 
+    def calculate_fees_batch(self, mempool_sizes: List[int], priorities: List[str]) -> List[int]:
+        """
+        Calculates fees for many transactions at once, e.g. when re-scoring the mempool.
+
+        Same arithmetic as calculate_fee, without the per-transaction logging.
+
+        Args:
+            mempool_sizes (List[int]): Mempool size seen by each transaction.
+            priorities (List[str]): Priority of each transaction.
+
+        Returns:
+            List[int]: The fee for each transaction, in input order.
+        """
+        low = PRIORITY_MULTIPLIERS["low"]
+        return [
+            _fee(PRIORITY_MULTIPLIERS.get(priority, low), mempool_size)
+            for mempool_size, priority in zip(mempool_sizes, priorities)
+        ]
+
     def estimate_confirmation_time(self, priority: str, current_tps: float) -> str:
         """
         Provides a human-readable estimate for transaction confirmation time.
@@ -98,16 +147,9 @@ class FeeModel:
         if total_fee < 1:
             return {"validator_share": 0, "ubi_share": 0, "carbon_share": 0, "gratitude_share": 0}
 
-        validator_share = int(total_fee * 0.6)
-        ubi_share = int(total_fee * 0.2)
-        carbon_share = int(total_fee * 0.1)
-        gratitude_share = int(total_fee * 0.1)
-
-        # Ensure the sum is exactly total_fee by giving the remainder to the validator
-        current_total = validator_share + ubi_share + carbon_share + gratitude_share
-        remainder = total_fee - current_total
-        validator_share += remainder
-
+        # Shares come from a cache keyed by fee (fees cluster on a few values);
+        # the dict is built fresh so callers can't alter a cached result
+        validator_share, ubi_share, carbon_share, gratitude_share = _split_fee(total_fee)
         breakdown = {
             "validator_share": validator_share,
             "ubi_share": ubi_share,
@@ -115,6 +157,5 @@ class FeeModel:
             "gratitude_share": gratitude_share
         }
         
-        assert sum(breakdown.values()) == total_fee
-        logging.info(f"Fee breakdown for {total_fee}: {breakdown}")
+        logger.info("Fee breakdown for %d: %s", total_fee, breakdown)
         return breakdown
@@ -104,9 +104,8 @@ class UBIEngine:
 
         logging.info(f"Starting UBI distribution. Fund: {ubi_fund_balance}, Humans: {num_verified_humans}, Amount/Person: {per_person_amount}")
 
-        # Distribute the funds
-        for address in self.verified_humans.keys():
-            self.ledger_state.credit(address, per_person_amount)
+        # Distribute the funds in a single bulk credit
+        self.ledger_state.credit_many(self.verified_humans, per_person_amount)
         
         # Deduct the total from the UBI fund
         self.ledger_state.ubi_fund -= total_to_distribute
@@ -13,7 +13,7 @@ import logging
 from .wisdom_oracle import WisdomOracle, ProposalVerdict
 from .justice import RestorativeJustice
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class ProposalType(Enum):
     """Types of governance proposals"""
@@ -32,7 +32,7 @@ class ProposalStatus(Enum):
     REJECTED = "rejected"
     IMPLEMENTED = "implemented"
 
-@dataclass
+@dataclass(slots=True)
 class Proposal:
     """A governance proposal with wisdom oracle integration"""
     id: str
@@ -60,17 +60,28 @@ class Proposal:
     # Voting
     votes_for: Dict[str, int] = field(default_factory=dict)  # voter_did -> weight
     votes_against: Dict[str, int] = field(default_factory=dict)
+    total_for: int = 0  # running sums of the two dicts above, kept by cast_vote
+    total_against: int = 0
     delegated_votes: Dict[str, str] = field(default_factory=dict)  # voter_did -> delegate_did
+    resolved_delegates: Dict[str, str] = field(default_factory=dict, repr=False)  # voter_did -> end of chain
     
     voting_start: Optional[int] = None
     voting_end: Optional[int] = None
     voting_power_snapshot: Dict[str, int] = field(default_factory=dict)  # voter_did -> voting power
+    required_threshold: float = 0.51  # for-ratio needed to pass, fixed when voting opens
     
     # Results
     passed: Optional[bool] = None
     implemented_at: Optional[int] = None
     implementation_results: Dict[str, Any] = field(default_factory=dict)
 
+@dataclass(frozen=True, slots=True)
+class ExecutionRecord:
+    """An entry in the engine's execution history; never changed once written"""
+    proposal_id: str
+    implemented_at: float
+    results: Dict[str, Any]
+
 class GovernanceEngine:
     """
     Complete governance system integrating Wisdom Oracle with community voting.
@@ -81,8 +92,8 @@ class GovernanceEngine:
         self.justice_system = justice_system
         self.proposals: Dict[str, Proposal] = {}
         self.voting_power_cache: Dict[str, int] = {}  # DID -> voting power (based on stake, reputation)
-        self.execution_history: List[Dict] = []
-        logging.info("GovernanceEngine initialized with Wisdom Oracle integration")
+        self.execution_history: List[ExecutionRecord] = []
+        logger.info("GovernanceEngine initialized with Wisdom Oracle integration")
     
     def create_proposal(self, 
                        title: str,
@@ -119,7 +130,7 @@ class GovernanceEngine:
         )
         
         self.proposals[proposal_id] = proposal
-        logging.info(f"Proposal {proposal_id} created: {title}")
+        logger.info("Proposal %s created: %s", proposal_id, title)
         
         # Automatically submit to Wisdom Oracle
         self._submit_to_wisdom_oracle(proposal_id, affected_principles)
@@ -184,12 +195,12 @@ class GovernanceEngine:
         if verdict.confidence < 0.3 and not is_constitutional:
             proposal.status = ProposalStatus.REJECTED
             proposal.passed = False
-            logging.info(f"Proposal {proposal_id} rejected by Wisdom Oracle (confidence: {verdict.confidence:.2f})")
+            logger.info("Proposal %s rejected by Wisdom Oracle (confidence: %.2f)", proposal_id, verdict.confidence)
         else:
             # Move to community vote
             proposal.status = ProposalStatus.COMMUNITY_VOTE
             self._start_voting(proposal_id)
-            logging.info(f"Proposal {proposal_id} passed Wisdom Oracle review. Moving to community vote.")
+            logger.info("Proposal %s passed Wisdom Oracle review. Moving to community vote.", proposal_id)
     
     def _start_voting(self, proposal_id: str):
         """Initialize voting period for a proposal"""
@@ -202,11 +213,28 @@ class GovernanceEngine:
         
         proposal.voting_start = time.time()
         proposal.voting_end = proposal.voting_start + (voting_days * 24 * 60 * 60)
+        proposal.required_threshold = self._required_threshold(proposal)
         
         # Snapshot voting power (simplified - in production, get from ledger)
         # This is where you'd query stake, reputation, etc.
         self._snapshot_voting_power(proposal_id)
     
+    def _required_threshold(self, proposal: Proposal) -> float:
+        """
+        For-ratio a proposal needs to pass. Type and oracle verdict are settled
+        before voting opens, so this is computed once rather than at every tally.
+        """
+        required = 0.51  # Simple majority
+        
+        if proposal.proposal_type == ProposalType.CONSTITUTIONAL:
+            required = 0.75  # Supermajority for constitutional changes
+        
+        # Wisdom oracle adds weight if it strongly endorsed
+        if proposal.wisdom_verdict and proposal.wisdom_verdict.confidence > 0.8:
+            required *= 0.9  # Lower threshold if wisdom strongly supports
+        
+        return required
+    
     def _snapshot_voting_power(self, proposal_id: str):
         """Take a snapshot of voting power at proposal creation"""
         proposal = self.proposals.get(proposal_id)
@@ -230,78 +258,129 @@ class GovernanceEngine:
         """
         proposal = self.proposals.get(proposal_id)
         if not proposal:
-            logging.error(f"Proposal {proposal_id} not found")
+            logger.error("Proposal %s not found", proposal_id)
             return False
         
         if proposal.status != ProposalStatus.COMMUNITY_VOTE:
-            logging.warning(f"Proposal {proposal_id} is not in voting phase")
+            logger.warning("Proposal %s is not in voting phase", proposal_id)
             return False
         
         current_time = time.time()
         if current_time < proposal.voting_start or current_time > proposal.voting_end:
-            logging.warning(f"Proposal {proposal_id} voting period is not active")
+            logger.warning("Proposal %s voting period is not active", proposal_id)
             return False
         
-        # Check for delegation
+        # Check for delegation; the vote goes to whoever ends the chain
         if voter_did in proposal.delegated_votes:
-            delegate = proposal.delegated_votes[voter_did]
-            logging.info(f"Vote from {voter_did} delegated to {delegate}")
-            return self.cast_vote(proposal_id, delegate, support, weight)
+            delegate = self._resolve_delegate(proposal, voter_did)
+            if delegate is None:
+                logger.warning("Vote from %s on %s follows a circular delegation", voter_did, proposal_id)
+                return False
+            logger.info("Vote from %s delegated to %s", voter_did, delegate)
+            voter_did = delegate
         
         # Record vote
         if support:
             proposal.votes_for[voter_did] = proposal.votes_for.get(voter_did, 0) + weight
+            proposal.total_for += weight
         else:
             proposal.votes_against[voter_did] = proposal.votes_against.get(voter_did, 0) + weight
+            proposal.total_against += weight
         
-        logging.info(f"Vote cast on {proposal_id} by {voter_did}: {'FOR' if support else 'AGAINST'} (weight: {weight})")
+        logger.info("Vote cast on %s by %s: %s (weight: %s)", proposal_id, voter_did, "FOR" if support else "AGAINST", weight)
         
-        # Check if voting is complete
-        self._check_voting_complete(proposal_id)
+        # Check if voting is complete, against the clock already read for this vote
+        self._check_voting_complete(proposal_id, current_time)
         return True
     
-    def _check_voting_complete(self, proposal_id: str):
+    def _resolve_delegate(self, proposal: Proposal, voter_did: str) -> Optional[str]:
+        """
+        Follow a delegation chain iteratively to the DID that actually votes.
+        
+        Every voter on the chain is remembered in proposal.resolved_delegates, so
+        later votes through the same chain resolve with one lookup.
+        
+        Returns:
+            The final delegate, or None if the chain loops back on itself
+        """
+        resolved = proposal.resolved_delegates.get(voter_did)
+        if resolved is not None:
+            return resolved
+        
+        chain = [voter_did]
+        seen = {voter_did}
+        delegate = voter_did
+        while delegate in proposal.delegated_votes:
+            delegate = proposal.delegated_votes[delegate]
+            if delegate in seen:
+                return None
+            resolved = proposal.resolved_delegates.get(delegate)
+            if resolved is not None:
+                delegate = resolved
+                break
+            chain.append(delegate)
+            seen.add(delegate)
+        
+        for voter in chain:
+            if voter != delegate:
+                proposal.resolved_delegates[voter] = delegate
+        return delegate
+    
+    def _check_voting_complete(self, proposal_id: str, current_time: Optional[float] = None):
         """Check if voting has ended and tally results"""
         proposal = self.proposals.get(proposal_id)
         if not proposal or proposal.status != ProposalStatus.COMMUNITY_VOTE:
             return
         
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
         if current_time < proposal.voting_end:
             return
         
         # Tally votes
-        total_for = sum(proposal.votes_for.values())
-        total_against = sum(proposal.votes_against.values())
+        total_for = proposal.total_for
+        total_against = proposal.total_against
         total_votes = total_for + total_against
         
         if total_votes == 0:
             proposal.passed = False
             proposal.status = ProposalStatus.REJECTED
-            logging.info(f"Proposal {proposal_id} rejected: no votes")
+            logger.info("Proposal %s rejected: no votes", proposal_id)
             return
         
         for_ratio = total_for / total_votes
         
-        # Determine required threshold
-        required = 0.51  # Simple majority
-        
-        if proposal.proposal_type == ProposalType.CONSTITUTIONAL:
-            required = 0.75  # Supermajority for constitutional changes
-        
-        # Wisdom oracle adds weight if it strongly endorsed
-        if proposal.wisdom_verdict and proposal.wisdom_verdict.confidence > 0.8:
-            required *= 0.9  # Lower threshold if wisdom strongly supports
+        required = proposal.required_threshold
         
         passed = for_ratio >= required
         proposal.passed = passed
         proposal.status = ProposalStatus.PASSED if passed else ProposalStatus.REJECTED
         
-        logging.info(f"Proposal {proposal_id} {'PASSED' if passed else 'REJECTED'} (for: {for_ratio:.2%}, required: {required:.2%})")
+        logger.info("Proposal %s %s (for: %.2f%%, required: %.2f%%)", proposal_id,
+                    "PASSED" if passed else "REJECTED", for_ratio * 100, required * 100)
         
         if passed:
             self._implement_proposal(proposal_id)
     
+    def tally_expired_proposals(self, current_time: Optional[float] = None) -> List[str]:
+        """
+        Tally every proposal whose voting period has ended, e.g. at the end of an epoch.
+        
+        Args:
+            current_time: Time to close voting at; defaults to now, read once for the batch
+        
+        Returns:
+            IDs of the proposals that were tallied
+        """
+        if current_time is None:
+            current_time = time.time()
+        
+        expired = [proposal.id for proposal in self.proposals.values()
+                   if proposal.status == ProposalStatus.COMMUNITY_VOTE and current_time >= proposal.voting_end]
+        for proposal_id in expired:
+            self._check_voting_complete(proposal_id, current_time)
+        return expired
+    
     def _implement_proposal(self, proposal_id: str):
         """Execute a passed proposal"""
         proposal = self.proposals.get(proposal_id)
@@ -341,13 +420,9 @@ class GovernanceEngine:
         proposal.implemented_at = time.time()
         proposal.status = ProposalStatus.IMPLEMENTED
         
-        self.execution_history.append({
-            "proposal_id": proposal_id,
-            "implemented_at": proposal.implemented_at,
-            "results": results
-        })
+        self.execution_history.append(ExecutionRecord(proposal_id, proposal.implemented_at, results))
         
-        logging.info(f"Proposal {proposal_id} implemented successfully")
+        logger.info("Proposal %s implemented successfully", proposal_id)
     
     def delegate_vote(self, proposal_id: str, voter_did: str, delegate_did: str):
         """Delegate voting power to another DID"""
@@ -356,7 +431,9 @@ class GovernanceEngine:
             return False
         
         proposal.delegated_votes[voter_did] = delegate_did
-        logging.info(f"Vote delegated: {voter_did} → {delegate_did} on proposal {proposal_id}")
+        # Any cached chain may now end somewhere else
+        proposal.resolved_delegates.clear()
+        logger.info("Vote delegated: %s → %s on proposal %s", voter_did, delegate_did, proposal_id)
         return True
     
     def get_proposal_status(self, proposal_id: str) -> Dict[str, Any]:
@@ -365,8 +442,8 @@ class GovernanceEngine:
         if not proposal:
             return {"error": "Proposal not found"}
         
-        total_for = sum(proposal.votes_for.values())
-        total_against = sum(proposal.votes_against.values())
+        total_for = proposal.total_for
+        total_against = proposal.total_against
         
         return {
             "id": proposal.id,
@@ -2,6 +2,7 @@
 # 6. RESTORATIVE JUSTICE
 # -------------------------------------
 from .wisdom_oracle import WisdomOracle
+import operator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict
@@ -47,10 +48,10 @@ class RestorativeJustice:
         if not dispute:
             return
         
-        # Choose mediator with highest relevant reputation
-        mediators = sorted(mediator_pool, key=lambda r: r.score, reverse=True)
-        if mediators:
-            dispute.mediator_did = mediators[0].did
+        # Choose mediator with highest relevant reputation (single O(n) pass)
+        best = max(mediator_pool, key=operator.attrgetter('score'), default=None)
+        if best:
+            dispute.mediator_did = best.did
             dispute.status = DisputeStatus.MEDIATION
     
     def propose_resolution(self, dispute_id: str, resolution: dict):
@@ -5,11 +5,18 @@ Restores the spiritual core of the original 808-line vision.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 import logging
+import random
+import re
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Private generator for display sampling, so UI requests don't share the global one
+_display_rng = random.Random()
 
 class Tradition(Enum):
     """Wisdom traditions represented in the oracle"""
@@ -21,6 +28,10 @@ class Tradition(Enum):
     JUDAIC = "judaic"
     HINDU = "hindu"
 
+# All traditions in definition order, and their names, resolved once
+_TRADITIONS = tuple(Tradition)
+_TRADITION_NAMES = {tradition: tradition.value for tradition in _TRADITIONS}
+
 @dataclass
 class WisdomQuote:
     """A single wisdom quote from a tradition"""
@@ -29,14 +40,14 @@ class WisdomQuote:
     source: str
     principle: str  # e.g., "compassion", "justice", "stewardship"
 
-@dataclass
+@dataclass(frozen=True)
 class EthicalAnalysis:
-    """Result of analyzing a proposal through one tradition"""
+    """Result of analyzing a proposal through one tradition (immutable, as results are cached)"""
     tradition: Tradition
     score: float  # 0-100, how well proposal aligns
     reasoning: str
-    concerns: List[str]
-    recommendations: List[str]
+    concerns: Tuple[str, ...]
+    recommendations: Tuple[str, ...]
 
 @dataclass
 class ProposalVerdict:
@@ -48,6 +59,94 @@ class ProposalVerdict:
     dissenting_traditions: List[Tradition]
     suggested_amendments: List[str]
 
+# Value mappings per tradition. Principles are only tested for membership, so
+# supports/warns become frozensets; the term lists are scanned in order and
+# stay ordered so reasoning strings come out the same every time.
+_TRADITION_VALUES_RAW = {
+    Tradition.CHRISTIAN: {
+        "supports": ["compassion", "forgiveness", "stewardship", "justice", "love"],
+        "warns": ["greed", "exploitation", "oppression"],
+        "positive_terms": ["mercy", "grace", "serve", "community", "poor"],
+        "negative_terms": ["dominate", "conquer", "accumulate", "exclude"]
+    },
+    Tradition.BUDDHIST: {
+        "supports": ["non-harm", "compassion", "mindfulness", "detachment"],
+        "warns": ["attachment", "craving", "harm"],
+        "positive_terms": ["suffering", "release", "awakening", "middle"],
+        "negative_terms": ["cling", "grasp", "desire", "violence"]
+    },
+    Tradition.INDIGENOUS: {
+        "supports": ["stewardship", "community", "ancestors", "seven generations"],
+        "warns": ["exploitation", "disrespect", "short-term"],
+        "positive_terms": ["land", "sacred", "balance", "circle", "gift"],
+        "negative_terms": ["take", "own", "dominate", "extract"]
+    },
+    Tradition.HUMANIST: {
+        "supports": ["dignity", "reason", "rights", "autonomy", "progress"],
+        "warns": ["dogma", "oppression", "irrational"],
+        "positive_terms": ["freedom", "choice", "education", "evidence"],
+        "negative_terms": ["blind", "obey", "authority", "suppress"]
+    },
+    Tradition.ISLAMIC: {
+        "supports": ["justice", "brotherhood", "mercy", "charity"],
+        "warns": ["injustice", "oppression", "waste"],
+        "positive_terms": ["peace", "compassion", "balance", "knowledge"],
+        "negative_terms": ["corruption", "excess", "harm", "injustice"]
+    },
+    Tradition.JUDAIC: {
+        "supports": ["justice", "repair", "dignity", "community"],
+        "warns": ["idolatry", "oppression", "injustice"],
+        "positive_terms": ["pursue", "heal", "remember", "holy"],
+        "negative_terms": ["false", "exploit", "forget", "ignore"]
+    },
+    Tradition.HINDU: {
+        "supports": ["dharma", "unity", "non-harm", "detachment"],
+        "warns": ["adharma", "illusion", "attachment"],
+        "positive_terms": ["sacred", "duty", "path", "liberation"],
+        "negative_terms": ["bind", "delude", "harm", "separate"]
+    }
+}
+
+# Every description term across all traditions, each assigned one bit
+_TERMS = tuple(dict.fromkeys(
+    term
+    for values in _TRADITION_VALUES_RAW.values()
+    for term in values["positive_terms"] + values["negative_terms"]
+))
+_TERM_BIT = {term: 1 << i for i, term in enumerate(_TERMS)}
+
+# One pass finds every term occurring in a description: the zero-width
+# lookahead matches at each position, longest alternative first
+_TERM_SCAN = re.compile("(?=(%s))" % "|".join(map(re.escape, sorted(_TERMS, key=len, reverse=True))))
+
+# A match also proves every shorter term contained in it (e.g. "exploit"
+# inside "exploitation"), which the longest-first alternation would skip
+_TERM_IMPLIES = {
+    term: sum(bit for other, bit in _TERM_BIT.items() if other in term)
+    for term in _TERMS
+}
+
+def _description_mask(description_lower: str) -> int:
+    """Bitmask of the vocabulary terms appearing anywhere in a lowercased description"""
+    mask = 0
+    for match in _TERM_SCAN.finditer(description_lower):
+        mask |= _TERM_IMPLIES[match.group(1)]
+    return mask
+
+def _terms_mask(terms) -> int:
+    """Bitmask covering the given vocabulary terms"""
+    mask = 0
+    for term in terms:
+        mask |= _TERM_BIT[term]
+    return mask
+
+# Reasoning, concern and recommendation strings kept per tradition analysis
+_MAX_NOTES = 3
+
+# Returned for traditions without a mapping
+_NO_VALUES = {"supports": frozenset(), "warns": frozenset(), "positive_terms": (), "negative_terms": (),
+              "positive_mask": 0, "negative_mask": 0}
+
 class WisdomOracle:
     """
     Multi-traditional ethical analysis engine for governance proposals.
@@ -58,6 +157,10 @@ class WisdomOracle:
     
     def __init__(self):
         self.quotes = self._initialize_wisdom()
+        # Quotes grouped by tradition, in seed order
+        self._quotes_by_tradition: Dict[Tradition, List[WisdomQuote]] = {}
+        for quote in self.quotes:
+            self._quotes_by_tradition.setdefault(quote.tradition, []).append(quote)
         self.tradition_weights = {
             Tradition.CHRISTIAN: 1.0,
             Tradition.BUDDHIST: 1.0,
@@ -67,7 +170,22 @@ class WisdomOracle:
             Tradition.JUDAIC: 1.0,
             Tradition.HINDU: 1.0
         }
-        logging.info(f"WisdomOracle initialized with {len(self.tradition_weights)} traditions")
+        # Analyses depend only on (tradition, description terms, principles), and
+        # replays / committee cross-checks re-submit the same proposals
+        self._analysis_cache = lru_cache(maxsize=4096)(self._score_tradition)
+        # Built once here rather than on every _analyze_tradition call
+        self._tradition_values = {
+            tradition: {
+                "supports": frozenset(values["supports"]),
+                "warns": frozenset(values["warns"]),
+                "positive_terms": tuple(values["positive_terms"]),
+                "negative_terms": tuple(values["negative_terms"]),
+                "positive_mask": _terms_mask(values["positive_terms"]),
+                "negative_mask": _terms_mask(values["negative_terms"])
+            }
+            for tradition, values in _TRADITION_VALUES_RAW.items()
+        }
+        logger.info("WisdomOracle initialized with %s traditions", len(self.tradition_weights))
     
     def _initialize_wisdom(self) -> List[WisdomQuote]:
         """Seed the oracle with foundational wisdom quotes"""
@@ -188,41 +306,48 @@ class WisdomOracle:
         Returns:
             ProposalVerdict with analysis from all traditions
         """
-        logging.info(f"Analyzing proposal: {proposal_title}")
+        logger.info("Analyzing proposal: %s", proposal_title)
+        
+        # Lowercase and scan the description once, not once per tradition
+        description_mask = _description_mask(proposal_description.lower())
         
         analyses = []
-        for tradition in Tradition:
+        consensus_traditions = []
+        dissenting_analyses = []
+        weighted_sum = 0
+        
+        # One pass classifies each tradition and accumulates the weighted score
+        for tradition in _TRADITIONS:
             analysis = self._analyze_tradition(
                 tradition, 
                 proposal_title,
-                proposal_description,
+                description_mask,
                 affected_principles
             )
             analyses.append(analysis)
-        
-        # Calculate consensus
-        passing_traditions = [a for a in analyses if a.score >= 70]
-        failing_traditions = [a for a in analyses if a.score < 70]
-        
-        consensus_traditions = [a.tradition for a in passing_traditions]
-        dissenting_traditions = [a.tradition for a in failing_traditions]
+            weighted_sum += analysis.score * self.tradition_weights[tradition]
+            if analysis.score >= 70:
+                consensus_traditions.append(tradition)
+            else:
+                dissenting_analyses.append(analysis)
+        dissenting_traditions = [a.tradition for a in dissenting_analyses]
         
         # Calculate confidence (weighted average)
-        total_weight = sum(self.tradition_weights.values())
-        weighted_sum = sum(a.score * self.tradition_weights[a.tradition] for a in analyses)
-        confidence = weighted_sum / total_weight / 100  # 0-1 scale
+        # Summed per call (seven floats) so direct edits to tradition_weights count
+        confidence = weighted_sum / sum(self.tradition_weights.values()) / 100  # 0-1 scale
         
         # Determine if proposal passes
         if is_constitutional:
             # Constitutional changes need 75% consensus across traditions
-            passes = (len(passing_traditions) / len(Tradition)) >= 0.75
+            passes = (len(consensus_traditions) / len(_TRADITIONS)) >= 0.75
         else:
             # Regular proposals need simple majority
-            passes = (len(passing_traditions) / len(Tradition)) >= 0.51
+            passes = (len(consensus_traditions) / len(_TRADITIONS)) >= 0.51
         
-        # Generate suggested amendments from dissenting traditions
+        # Generate suggested amendments from dissenting traditions, worst-scoring
+        # first so the strongest objections survive the cut to five
         suggested_amendments = []
-        for analysis in failing_traditions:
+        for analysis in sorted(dissenting_analyses, key=attrgetter('score')):
             suggested_amendments.extend(analysis.recommendations[:2])  # Top 2 from each
         
         verdict = ProposalVerdict(
@@ -231,27 +356,52 @@ class WisdomOracle:
             analyses=analyses,
             consensus_traditions=consensus_traditions,
             dissenting_traditions=dissenting_traditions,
-            suggested_amendments=list(set(suggested_amendments))[:5]  # Unique, max 5
+            suggested_amendments=list(dict.fromkeys(suggested_amendments))[:5]  # Unique in order, max 5
         )
         
-        logging.info(f"Analysis complete. Passes: {passes}, Confidence: {confidence:.2f}")
+        logger.info("Analysis complete. Passes: %s, Confidence: %.2f", passes, confidence)
         return verdict
     
+    def set_tradition_weight(self, tradition: Tradition, weight: float):
+        """
+        Change how much one tradition counts toward proposal confidence.
+        
+        Args:
+            tradition: Tradition to reweight
+            weight: New weight (1.0 is the default)
+        """
+        self.tradition_weights[tradition] = weight
+    
     def _analyze_tradition(self, 
                           tradition: Tradition,
                           title: str,
-                          description: str,
+                          description_mask: int,
                           principles: List[str]) -> EthicalAnalysis:
         """
         Analyze proposal through a single tradition.
         
+        `description_mask` is the proposal description's term bitmask from
+        _description_mask, computed once per proposal by analyze_proposal.
+        
         This is a simplified implementation. In production, this could use:
         - Fine-tuned LLMs per tradition
         - Rule-based ethical frameworks
         - Community voting by tradition representatives
         """
+        # The title does not affect the analysis, so it is left out of the cache key
+        return self._analysis_cache(tradition, description_mask, tuple(principles))
+    
+    def _score_tradition(self,
+                         tradition: Tradition,
+                         description_mask: int,
+                         principles: Tuple[str, ...]) -> EthicalAnalysis:
+        """Uncached body of _analyze_tradition"""
+        name = _TRADITION_NAMES[tradition]
+        
         # Base score starts at 50 (neutral)
         score = 50.0
+        # Only the first few strings of each kind are kept, so formatting
+        # stops once a list is full; the score still counts every match
         reasoning = []
         concerns = []
         recommendations = []
@@ -263,97 +413,63 @@ class WisdomOracle:
         for principle in principles:
             if principle in tradition_values["supports"]:
                 score += 10
-                reasoning.append(f"Principle '{principle}' aligns with {tradition.value} values")
+                if len(reasoning) < _MAX_NOTES:
+                    reasoning.append(f"Principle '{principle}' aligns with {name} values")
             elif principle in tradition_values["warns"]:
                 score -= 15
-                concerns.append(f"Principle '{principle}' raises concerns in {tradition.value} tradition")
-                recommendations.append(f"Consider how to address {principle} in light of {tradition.value} wisdom")
+                if len(concerns) < _MAX_NOTES:
+                    concerns.append(f"Principle '{principle}' raises concerns in {name} tradition")
+                if len(recommendations) < _MAX_NOTES:
+                    recommendations.append(f"Consider how to address {principle} in light of {name} wisdom")
         
         # Check for key terms in description
-        description_lower = description.lower()
-        
-        # Positive indicators
-        for term in tradition_values["positive_terms"]:
-            if term in description_lower:
-                score += 5
-                reasoning.append(f"Contains '{term}' which resonates with {tradition.value}")
+        # Positive indicators: one AND against the tradition's term mask
+        positive_hits = description_mask & tradition_values["positive_mask"]
+        if positive_hits:
+            score += 5 * positive_hits.bit_count()
+            for term in tradition_values["positive_terms"]:
+                if len(reasoning) >= _MAX_NOTES:
+                    break
+                if positive_hits & _TERM_BIT[term]:
+                    reasoning.append(f"Contains '{term}' which resonates with {name}")
         
         # Negative indicators
-        for term in tradition_values["negative_terms"]:
-            if term in description_lower:
-                score -= 10
-                concerns.append(f"Contains '{term}' which may conflict with {tradition.value}")
-                recommendations.append(f"Reframe language around '{term}' to better align with {tradition.value} wisdom")
+        negative_hits = description_mask & tradition_values["negative_mask"]
+        if negative_hits:
+            score -= 10 * negative_hits.bit_count()
+            for term in tradition_values["negative_terms"]:
+                if len(concerns) >= _MAX_NOTES and len(recommendations) >= _MAX_NOTES:
+                    break
+                if negative_hits & _TERM_BIT[term]:
+                    if len(concerns) < _MAX_NOTES:
+                        concerns.append(f"Contains '{term}' which may conflict with {name}")
+                    if len(recommendations) < _MAX_NOTES:
+                        recommendations.append(f"Reframe language around '{term}' to better align with {name} wisdom")
         
         # Clamp score to 0-100
         score = max(0, min(100, score))
         
         # Add tradition-specific wisdom quote
-        tradition_quotes = [q for q in self.quotes if q.tradition == tradition]
-        if tradition_quotes:
+        tradition_quotes = self._quotes_by_tradition.get(tradition, ())
+        if tradition_quotes and len(reasoning) < _MAX_NOTES:
             quote = tradition_quotes[0]  # Just use first for demo
             reasoning.append(f"Wisdom reminder: '{quote.quote}' — {quote.source}")
         
         return EthicalAnalysis(
             tradition=tradition,
             score=score,
-            reasoning=" ".join(reasoning[:3]),  # Summarize
-            concerns=concerns[:3],
-            recommendations=recommendations[:3]
+            reasoning=" ".join(reasoning),  # Summarize
+            concerns=tuple(concerns),
+            recommendations=tuple(recommendations)
         )
     
     def _get_tradition_values(self, tradition: Tradition) -> Dict[str, Any]:
         """Get value mappings for a tradition"""
-        values = {
-            Tradition.CHRISTIAN: {
-                "supports": ["compassion", "forgiveness", "stewardship", "justice", "love"],
-                "warns": ["greed", "exploitation", "oppression"],
-                "positive_terms": ["mercy", "grace", "serve", "community", "poor"],
-                "negative_terms": ["dominate", "conquer", "accumulate", "exclude"]
-            },
-            Tradition.BUDDHIST: {
-                "supports": ["non-harm", "compassion", "mindfulness", "detachment"],
-                "warns": ["attachment", "craving", "harm"],
-                "positive_terms": ["suffering", "release", "awakening", "middle"],
-                "negative_terms": ["cling", "grasp", "desire", "violence"]
-            },
-            Tradition.INDIGENOUS: {
-                "supports": ["stewardship", "community", "ancestors", "seven generations"],
-                "warns": ["exploitation", "disrespect", "short-term"],
-                "positive_terms": ["land", "sacred", "balance", "circle", "gift"],
-                "negative_terms": ["take", "own", "dominate", "extract"]
-            },
-            Tradition.HUMANIST: {
-                "supports": ["dignity", "reason", "rights", "autonomy", "progress"],
-                "warns": ["dogma", "oppression", "irrational"],
-                "positive_terms": ["freedom", "choice", "education", "evidence"],
-                "negative_terms": ["blind", "obey", "authority", "suppress"]
-            },
-            Tradition.ISLAMIC: {
-                "supports": ["justice", "brotherhood", "mercy", "charity"],
-                "warns": ["injustice", "oppression", "waste"],
-                "positive_terms": ["peace", "compassion", "balance", "knowledge"],
-                "negative_terms": ["corruption", "excess", "harm", "injustice"]
-            },
-            Tradition.JUDAIC: {
-                "supports": ["justice", "repair", "dignity", "community"],
-                "warns": ["idolatry", "oppression", "injustice"],
-                "positive_terms": ["pursue", "heal", "remember", "holy"],
-                "negative_terms": ["false", "exploit", "forget", "ignore"]
-            },
-            Tradition.HINDU: {
-                "supports": ["dharma", "unity", "non-harm", "detachment"],
-                "warns": ["adharma", "illusion", "attachment"],
-                "positive_terms": ["sacred", "duty", "path", "liberation"],
-                "negative_terms": ["bind", "delude", "harm", "separate"]
-            }
-        }
-        return values.get(tradition, {"supports": [], "warns": [], "positive_terms": [], "negative_terms": []})
+        return self._tradition_values.get(tradition, _NO_VALUES)
     
     def get_wisdom_for_display(self, count: int = 3) -> List[Dict[str, str]]:
         """Get random wisdom quotes for UI display"""
-        import random
-        selected = random.sample(self.quotes, min(count, len(self.quotes)))
+        selected = _display_rng.sample(self.quotes, min(count, len(self.quotes)))
         return [
             {
                 "tradition": q.tradition.value,
@@ -1,9 +1,8 @@
 
 import logging
-from collections import defaultdict
-from typing import Dict
+from typing import Dict, Iterable, List, Tuple
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class LedgerState:
     """
@@ -12,8 +11,9 @@ class LedgerState:
     backed by a persistent, auditable database.
     """
     def __init__(self):
-        # Account balances for all users/contracts
-        self.balances = defaultdict(int)
+        # Account balances for all users/contracts. A plain dict read with get(), so
+        # only addresses that have actually been credited or debited take up an entry
+        self.balances: Dict[str, int] = {}
 
         # --- System-wide Fee Pools ---
         # Renaming ubi_fund for consistency, it's one of the four pools.
@@ -22,7 +22,7 @@ class LedgerState:
         self.carbon_share_pool = 0
         self.gratitude_share_pool = 0
         
-        logging.info("LedgerState initialized with empty balances and fee pools.")
+        logger.info("LedgerState initialized with empty balances and fee pools.")
 
     def apply_transaction(self, sender: str, recipient: str, amount: int, fee: int) -> bool:
         """
@@ -38,16 +38,55 @@ class LedgerState:
         Returns:
             bool: True if the transaction was applied successfully, False otherwise.
         """
+        if not self._transfer(sender, recipient, amount, fee):
+            return False
+        # Called per transaction; skip even the argument lookups when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Applied transaction: %s -> %s (%s). New balances: Sender=%s, Recipient=%s",
+                        sender, recipient, amount, self.balances[sender], self.balances[recipient])
+        return True
+
+    def _transfer(self, sender: str, recipient: str, amount: int, fee: int) -> bool:
+        """
+        Moves amount + fee out of the sender and amount into the recipient.
+        The balance rules shared by apply_transaction and apply_transactions;
+        only a failure is logged here.
+        """
         total_debit = amount + fee
-        if self.balances[sender] < total_debit:
-            logging.warning(f"Transaction failed: Insufficient funds for sender {sender}. Has {self.balances[sender]}, needs {total_debit}.")
+        sender_balance = self.balances.get(sender, 0)
+        if sender_balance < total_debit:
+            logger.warning("Transaction failed: Insufficient funds for sender %s. Has %s, needs %s.", sender, sender_balance, total_debit)
             return False
 
-        self.balances[sender] -= total_debit
-        self.balances[recipient] += amount
-        logging.info(f"Applied transaction: {sender} -> {recipient} ({amount}). New balances: Sender={self.balances[sender]}, Recipient={self.balances[recipient]}")
+        if sender == recipient:
+            # A self-transfer only costs the fee: one write instead of debit + credit
+            self.balances[sender] = sender_balance - fee
+        else:
+            self.balances[sender] = sender_balance - total_debit
+            self.balances[recipient] = self.balances.get(recipient, 0) + amount
         return True
 
+    def apply_transactions(self, transactions: Iterable[Tuple[str, str, int, int]]) -> List[bool]:
+        """
+        Applies a batch of transactions in order, logging once for the batch.
+
+        Each transaction is checked against the balances left by the ones before it,
+        exactly as if apply_transaction were called for each in turn; only failures
+        are logged individually.
+
+        Args:
+            transactions (Iterable[Tuple[str, str, int, int]]): (sender, recipient, amount, fee) tuples.
+
+        Returns:
+            List[bool]: Whether each transaction was applied, in input order.
+        """
+        transfer = self._transfer
+        results = [transfer(sender, recipient, amount, fee)
+                   for sender, recipient, amount, fee in transactions]
+
+        logger.info("Applied %s of %s transactions in batch.", sum(results), len(results))
+        return results
+
     def distribute_fee(self, fee_breakdown: Dict[str, int]):
         """
         Distributes a collected fee into the four system-wide pools.
@@ -59,7 +98,9 @@ class LedgerState:
         self.ubi_share_pool += fee_breakdown.get("ubi_share", 0)
         self.carbon_share_pool += fee_breakdown.get("carbon_share", 0)
         self.gratitude_share_pool += fee_breakdown.get("gratitude_share", 0)
-        logging.info(f"Fee distributed. Current pools: UBI={self.ubi_share_pool}, Validator={self.validator_share_pool}, Carbon={self.carbon_share_pool}, Gratitude={self.gratitude_share_pool}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Fee distributed. Current pools: UBI=%s, Validator=%s, Carbon=%s, Gratitude=%s",
+                        self.ubi_share_pool, self.validator_share_pool, self.carbon_share_pool, self.gratitude_share_pool)
 
 
     def credit(self, address: str, amount: int):
@@ -71,11 +112,32 @@ class LedgerState:
             amount (int): The amount to credit.
         """
         if amount < 0:
-            logging.warning(f"Attempted to credit a negative amount {-amount} to {address}. Operation aborted.")
+            logger.warning("Attempted to credit a negative amount %s to %s. Operation aborted.", -amount, address)
             return
             
-        self.balances[address] += amount
-        logging.info(f"Credited {amount} to {address}. New balance: {self.balances[address]}.")
+        self.balances[address] = self.balances.get(address, 0) + amount
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Credited %s to %s. New balance: %s.", amount, address, self.balances[address])
+
+    def credit_many(self, addresses: Iterable[str], amount: int):
+        """
+        Credits the same amount to every address in one pass, logging once for the batch.
+        Used for UBI payouts, where per-address credit() calls would log once per human.
+
+        Args:
+            addresses (Iterable[str]): The recipients' addresses.
+            amount (int): The amount to credit to each address.
+        """
+        if amount < 0:
+            logger.warning("Attempted to credit a negative amount %s in bulk. Operation aborted.", -amount)
+            return
+
+        balances = self.balances
+        count = 0
+        for address in addresses:
+            balances[address] = balances.get(address, 0) + amount
+            count += 1
+        logger.info("Credited %s to each of %s addresses.", amount, count)
 
     def get_balance(self, address: str) -> int:
         """
@@ -1,16 +1,20 @@
 
 import logging
-from typing import List
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Set
 
 from .crypto_core.dag import DAG
-from .crypto_core.consensus import QDBFT, CommitteeManager
+from .crypto_core.consensus import QDBFT, CommitteeManager, VERIFY_POOL
 from .crypto_core.real_mldsa_service import RealMLDSAService
 from .crypto_core.transactions import Transaction
 from .crypto_core.vertex import Vertex, SuperVertex
 from .ledger.state import LedgerState
 from .economics.fee_model import FeeModel
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Transaction signatures remembered as valid, so a transaction seen again is not re-verified
+VERIFIED_CACHE_SIZE = 10_000
 
 class Node:
     """
@@ -26,8 +30,15 @@ class Node:
         self.dag = DAG()
         self.ledger_state = LedgerState()
         self.fee_model = FeeModel()
-        self.consensus_engine = QDBFT(self.node_id, committee_manager, self.mldsa_service)
+        self.consensus_engine = QDBFT(self.node_id, committee_manager, self.mldsa_service, self.known_peers)
         self.mempool: List[Transaction] = []
+        # Transaction signatures of a finalized super-vertex are checked in parallel
+        # on the process-wide pool; liboqs runs outside the GIL, so threads scale with cores
+        self._verify_pool = VERIFY_POOL
+        # (content hash, signature, public key) of valid transactions, least recently seen first
+        self._verified: OrderedDict = OrderedDict()
+        # Super-vertices already applied to this node's ledger
+        self._processed_super_vertices: Set[str] = set()
 
     def create_transaction(self, recipient: str, amount: int, fee: int) -> Transaction:
         """
@@ -42,52 +53,101 @@ class Node:
         message_to_sign = tx.to_message()
         tx.signature = self.mldsa_service.sign(self.keypair['private_key'], message_to_sign)
         self.mempool.append(tx)
-        logging.info(f"Node {self.node_id} created transaction {tx.id}.")
+        logger.info("Node %s created transaction %s.", self.node_id, tx.id)
         return tx
 
+    def submit_transactions(self, transactions: Iterable[Transaction]) -> int:
+        """
+        Adds a batch of transactions received from other nodes to the mempool.
+
+        Args:
+            transactions (Iterable[Transaction]): The transactions to queue.
+
+        Returns:
+            int: The mempool size after the batch was added.
+        """
+        self.mempool.extend(transactions)
+        logger.info("Node %s mempool now holds %d transactions.", self.node_id, len(self.mempool))
+        return len(self.mempool)
+
     def create_vertex(self):
         """
         Creates a new vertex from transactions in the mempool.
         """
         if not self.mempool:
-            logging.info(f"Node {self.node_id} has no transactions in mempool to create a vertex.")
+            logger.info("Node %s has no transactions in mempool to create a vertex.", self.node_id)
             return None
 
         parent_hashes = self.dag.get_tips() or ['genesis'] # Simplified genesis
+        # Hand the mempool list itself to the vertex and start a fresh one,
+        # rather than copying every reference and then clearing the original
+        transactions, self.mempool = self.mempool, []
         vertex = Vertex(
-            transactions=list(self.mempool),
+            transactions=transactions,
             parent_hashes=parent_hashes,
             creator_id=self.node_id
         )
         vertex.signature = self.mldsa_service.sign(self.keypair['private_key'], vertex.hash.encode())
         
-        self.mempool.clear()
         self.dag.add_vertex(vertex)
-        logging.info(f"Node {self.node_id} created vertex {vertex.hash}.")
+        logger.info("Node %s created vertex %s.", self.node_id, vertex.hash)
         return vertex
 
     def process_finalized_super_vertex(self, super_vertex: SuperVertex):
         """
         Processes a finalized super-vertex, applying its transactions to the ledger.
         """
-        logging.info(f"Node {self.node_id} processing finalized super-vertex {super_vertex.hash}.")
+        if super_vertex.hash in self._processed_super_vertices:
+            logger.warning("Node %s already processed super-vertex %s. Skipping.", self.node_id, super_vertex.hash)
+            return
+        self._processed_super_vertices.add(super_vertex.hash)
+
+        logger.info("Node %s processing finalized super-vertex %s.", self.node_id, super_vertex.hash)
+        jobs = []
         for vertex_hash in super_vertex.cohort_hashes:
             vertex = self.dag.get_vertex(vertex_hash)
             if not vertex:
-                logging.warning(f"Vertex {vertex_hash} from finalized super-vertex not found in DAG.")
+                logger.warning("Vertex %s from finalized super-vertex not found in DAG.", vertex_hash)
                 continue
 
             for tx in vertex.transactions:
                 sender_pub_key = self.known_peers.get(tx.sender)
                 if not sender_pub_key:
-                    logging.error(f"Public key for sender {tx.sender} not found. Cannot verify transaction {tx.calculate_hash()}.")
+                    logger.error("Public key for sender %s not found. Cannot verify transaction %s.", tx.sender, tx.calculate_hash())
                     continue
+                jobs.append((tx, sender_pub_key))
+
+        # Only signatures not already known to be valid go to the verifier
+        verified = self._verified
+        keys = [(tx.content_hash(), tx.signature, sender_pub_key) for tx, sender_pub_key in jobs]
+        valid = [True] * len(jobs)
+        unchecked = []
+        for i, key in enumerate(keys):
+            if key in verified:
+                verified.move_to_end(key)
+            else:
+                unchecked.append(i)
+
+        verify = self.mldsa_service.verify
+        results = self._verify_pool.map(lambda i: verify(jobs[i][1], jobs[i][0].to_message(), jobs[i][0].signature), unchecked)
+        for i, is_valid in zip(unchecked, results):
+            valid[i] = is_valid
+            if is_valid:
+                verified[keys[i]] = None
+                if len(verified) > VERIFIED_CACHE_SIZE:
+                    verified.popitem(last=False)
+
+        # Results are kept in job order, so the ledger is updated in the same
+        # deterministic order as the cohort regardless of which check finished first
+        valid_txs = []
+        for (tx, _), is_valid in zip(jobs, valid):
+            if is_valid:
+                valid_txs.append(tx)
+            else:
+                logger.error("Invalid signature for transaction %s in finalized vertex. Skipping.", tx.calculate_hash())
 
-                is_valid = self.mldsa_service.verify(sender_pub_key, tx.to_message(), tx.signature)
-                if is_valid:
-                    success = self.ledger_state.apply_transaction(tx.sender, tx.recipient, tx.amount, tx.fee)
-                    if success:
-                        fee_breakdown = self.fee_model.get_fee_breakdown(tx.fee)
-                        self.ledger_state.distribute_fee(fee_breakdown)
-                else:
-                    logging.error(f"Invalid signature for transaction {tx.calculate_hash()} in finalized vertex. Skipping.")
+        applied = self.ledger_state.apply_transactions((tx.sender, tx.recipient, tx.amount, tx.fee) for tx in valid_txs)
+        for tx, success in zip(valid_txs, applied):
+            if success:
+                fee_breakdown = self.fee_model.get_fee_breakdown(tx.fee)
+                self.ledger_state.distribute_fee(fee_breakdown)